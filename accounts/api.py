@@ -1,8 +1,11 @@
+import math
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from django.contrib.auth import authenticate
-from django.db import IntegrityError
+from django.contrib.auth import aauthenticate
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
 from ninja import Router
 from ninja_jwt.tokens import AccessToken
@@ -18,34 +21,62 @@ from accounts.schemas import (
     UserPartialUpdateInSchema,
     UserPartialUpdateOutSchema,
 )
+from articles import timeline
 from helpers.empty import EMPTY
+from helpers import auth, hashing, throttling, uniqueness
 from helpers.auth import AuthJWT
 from helpers.exceptions import clean_integrity_error
 
 router = Router()
 
 
-@router.post("/user", response={201: Any, 400: Any, 409: Any})
-def account_registration(request, data: UserCreateSchema):
+def _saturated(response: HttpResponse) -> tuple[int, dict]:
+    response["Retry-After"] = str(settings.PASSWORD_HASHING_RETRY_AFTER)
+    return 503, {"detail": [{"msg": "too many requests, retry later"}]}
+
+
+@router.post("/user", response={201: Any, 400: Any, 409: Any, 503: Any})
+async def account_registration(request, data: UserCreateSchema, response: HttpResponse):
+    conflict = await sync_to_async(uniqueness.taken)(
+        User, email=data.user.email, username=data.user.username
+    )
+    if conflict:
+        return 409, {"already_existing": conflict}
     try:
-        user = User.objects.get(
-            data.user.email, username=data.user.username, password=data.user.password
-        )
+        password = await hashing.make_password(data.user.password)
+    except hashing.PoolSaturated:
+        return _saturated(response)
+    user = User(email=data.user.email, username=data.user.username, password=password)
+    try:
+        await user.asave()
     except IntegrityError as error:
-        return 409, {"already_existing": clean_integrity_error(error)}
+        # May query the catalog to name the constraint.
+        conflict = await sync_to_async(clean_integrity_error)(error)
+        return 409, {"already_existing": conflict}
     jwt_token = AccessToken.for_user(user)
     return 201, {
         "username": user.username,
         "email": user.email,
-        "bio": data.bio or None,
-        "image": data.image or settings.DEFAULT_USER_IMAGE,
+        "bio": user.bio or None,
+        "image": user.image or settings.DEFAULT_USER_IMAGE,
         "token": str(jwt_token),
     }
 
 
-@router.post("/usres/login", response={201: Any, 400: Any, 401: Any})
-def account_login(request, data: UserLoginSchema):
-    user = authenticate(email=data.user.email, password=data.user.password)
+@router.post(
+    "/usres/login", response={200: Any, 400: Any, 401: Any, 429: Any, 503: Any}
+)
+async def account_login(request, data: UserLoginSchema, response: HttpResponse):
+    wait = await sync_to_async(throttling.check_login)(request, data.user.email)
+    if wait:
+        response["Retry-After"] = str(math.ceil(wait))
+        return 429, {"detail": [{"msg": "too many login attempts, retry later"}]}
+    try:
+        user = await aauthenticate(
+            request, email=data.user.email, password=data.user.password
+        )
+    except hashing.PoolSaturated:
+        return _saturated(response)
     if user is None:
         return 401, {"detail": [{"msg": "incorrect credentials"}]}
     jwt_token = AccessToken.for_user(user)
@@ -60,27 +91,44 @@ def account_login(request, data: UserLoginSchema):
     }
 
 
+@router.get("/metrics", auth=AuthJWT(), response={200: Any, 401: Any, 403: Any})
+def metrics(request):
+    """Counters of the worker that answers; staff only."""
+    if not request.user.is_staff:
+        return 403, None
+    return {"authCache": auth.cache_stats(), "loginThrottle": throttling.stats()}
+
+
 @router.get("/user", auth=AuthJWT(), response={200: Any, 404: Any})
 def get_user(request) -> UserGetSchema:
     return {"user", UserMineSchema.from_orm(request.user)}
 
 
-@router.put("/user", auth=AuthJWT(), response={200: Any, 400: Any, 401: Any})
-def put_user(request, data: UserPartialUpdateInSchema) -> UserPartialUpdateInSchema:
-
+@router.put("/user", auth=AuthJWT(), response={200: Any, 400: Any, 401: Any, 503: Any})
+async def put_user(
+    request, data: UserPartialUpdateInSchema, response: HttpResponse
+) -> UserPartialUpdateInSchema:
+    # request.user may be a cached snapshot; write onto the current row and
+    # only the columns this request changes.
+    user = await User.objects.aget(pk=request.user.pk)
+    changed = []
     for word in ("email", "username", "bio", "image"):
         value = getattr(data.user, word)
         if value != EMPTY:
-            setattr(request.user, word, value)
-        if data.user.password != EMPTY:
-            request.user.set_password(data.user.password)
-        request.user.save()
-        token = AccessToken.for_user(request.user)
-        return {
-            "user": UserInPartialUpdateOutSchema.from_orm(
-                request.user, context={"token": token}
-            )
-        }
+            setattr(user, word, value)
+            changed.append(word)
+    if data.user.password != EMPTY:
+        try:
+            user.password = await hashing.make_password(data.user.password)
+        except hashing.PoolSaturated:
+            return _saturated(response)
+        changed.append("password")
+    # Saving also drops the user from the authentication cache.
+    await user.asave(update_fields=changed)
+    token = AccessToken.for_user(user)
+    return {
+        "user": UserInPartialUpdateOutSchema.from_orm(user, context={"token": token})
+    }
 
 
 @router.post(
@@ -94,7 +142,9 @@ def follow_profile(request, username: str) -> UserPartialUpdateOutSchema:
         return 403, None
     if profile.followers.filter(pk=request.user.id).exists():
         return 409, None
-    profile.followers.add(request.user)
+    with transaction.atomic():
+        profile.followers.add(request.user)
+        timeline.backfill(request.user, profile)
     return {"profile": ProfileSchema.from_orm(profile, context={"request": request})}
 
 
@@ -109,5 +159,7 @@ def unfollow_profile(request, username: str) -> UserPartialUpdateOutSchema:
         return 403, None
     if not profile.followers.filter(pk=request.user.id).exists():
         return 404, None
-    profile.followers.remove(request.user)
+    with transaction.atomic():
+        profile.followers.remove(request.user)
+        timeline.prune(request.user, profile)
     return {"profile": ProfileSchema.from_orm(profile, context={"request": request})}
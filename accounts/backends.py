@@ -0,0 +1,34 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+
+from helpers import hashing
+
+UserModel = get_user_model()
+
+
+class PooledModelBackend(ModelBackend):
+    """`ModelBackend` whose async path hashes on `helpers.hashing`'s pool.
+
+    `aauthenticate()` raises `hashing.PoolSaturated` when the pool is full, so
+    callers can answer 503 instead of queueing the request.
+    """
+
+    async def aauthenticate(self, request, username=None, password=None, **kwargs):
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return
+        try:
+            user = await UserModel._default_manager.aget_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # Hash anyway so unknown accounts answer as slowly as known ones.
+            await hashing.verify_password(password, "")
+            return
+        valid, must_update = await hashing.verify_password(password, user.password)
+        if not valid:
+            return
+        if must_update:
+            user.password = await hashing.make_password(password)
+            await user.asave(update_fields=["password"])
+        if self.user_can_authenticate(user):
+            return user
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:48
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="user",
+            name="following",
+            field=models.ManyToManyField(
+                blank=True, related_name="followers", to=settings.AUTH_USER_MODEL
+            ),
+        ),
+    ]
@@ -42,7 +42,9 @@ class User(AbstractUser):
     bio: str = models.TextField(help_text="Bio")
     image: str = models.URLField(null=True, blank=True, help_text="Image url")
 
-    following = models.ManyToManyField("self", blank=True, symmetrical=False)
+    following = models.ManyToManyField(
+        "self", blank=True, symmetrical=False, related_name="followers"
+    )
 
     EMAIL_FIELD = "email"
     USERNAME_FIELD = "email"
@@ -65,8 +67,6 @@ class User(AbstractUser):
         )
 
     def is_following(self, other_user):
-        return (
-            other_user.followers.filter(pk=self.id).exists()
-            if self.is_authenticated
-            else False
-        )
+        from accounts.follows import followees
+
+        return other_user.id in followees(self)
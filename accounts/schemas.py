@@ -3,6 +3,7 @@ from django.conf import settings
 from ninja import ModelSchema, Schema
 from pydantic import AfterValidator, EmailStr, ValidationInfo, field_validator
 
+from accounts.follows import followees
 from accounts.models import User
 from helpers.empty import EMPTY
 
@@ -22,12 +23,10 @@ class ProfileSchema(ModelSchema):
 
     @staticmethod
     def resolve_following(obj, context) -> bool:
-        user = context.get("request").user
-        return (
-            obj.followers.filter(id=user.id).exists()
-            if user and user.is_authenticated
-            else False
-        )
+        following = context.get("following")
+        if following is not None:
+            return obj.id in following
+        return obj.id in followees(context.get("request").user)
 
     @staticmethod
     def resolve_bio(obj, context) -> str | None:
@@ -38,6 +37,21 @@ class ProfileSchema(ModelSchema):
         return obj.image or settings.DEFAULT_USER_IMAGE
 
 
+# Columns read by `profile_from_row`, the projection counterpart of
+# `ProfileSchema` used by the list endpoints.
+PROFILE_FIELDS = ("id", "username", "bio", "image")
+
+
+def profile_from_row(row: dict, following: bool) -> dict:
+    """`ProfileSchema` output built straight from a `.values(*PROFILE_FIELDS)` row."""
+    return {
+        "following": following,
+        "bio": row["bio"] or None,
+        "image": row["image"] or settings.DEFAULT_USER_IMAGE,
+        "username": row["username"],
+    }
+
+
 class UserInCreateSchema(ModelSchema):
     email: EmailStr
 
@@ -61,7 +75,7 @@ class UserInLoginSchema(ModelSchema):
 
     class Meta:
         model = User
-        fields = ["username", "password"]
+        fields = ["email", "password"]
 
     @field_validator("email", "password", check_fields=False)
     @classmethod
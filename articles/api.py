@@ -1,21 +1,36 @@
-from typing import Any
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
 from django.db import transaction, IntegrityError
 from django.shortcuts import get_object_or_404
-from ninja import Router
-from taggit.models import Tag
-from django.http import HttpRequest
+from ninja import Query, Router
+from django.http import Http404, HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response
 
-from accounts.models import User
-from articles.models import Article
+from articles import cache as article_cache
+from articles import deletion, importer, search, timeline
+from articles.counters import views
+from articles.filters import ArticleFilter
+from articles.loaders import project_articles, serialize_articles
+from articles.models import Article, TimelineEntry, article_slug
 from articles.schemas import (
+    ARTICLE_FIELDS,
     ArticleCreateSchema,
-    ArticleOutSchema,
     ArticlePartialUpdateSchema,
 )
+from articles.tags import add_tags, popular_tags
 from helpers.auth import AuthJWT
 from helpers.empty import EMPTY
 from helpers.exceptions import clean_integrity_error
-
+from helpers import uniqueness
+from helpers.pagination import (
+    InvalidCursor,
+    after_cursor,
+    count,
+    count_key,
+    paginate,
+)
+from helpers.streaming import chunked, stream_json
 
 router = Router()
 
@@ -27,17 +42,9 @@ router = Router()
     tags=["articles"],
 )
 def favorite(request, slug: str):
-    article = get_object_or_404(Article.objects.with_favorites(request.user), slug=slug)
-    if article.favorites.filter(id=request.user.id).exists():
-        return 409, {"error": {"body": ["This article has been favorited."]}}
-    article.favorites.add(request.user)
-    article = get_object_or_404(
-        Article.objects.with_favorites(request.user), id=article.id
-    )
-    return {"article": ArticleOutSchema.from_orm(article, complex={"request": request})}
+    return _set_favorite(request, slug, Article.objects.add_favorite, True)
 
 
-#
 @router.delete(
     "/articles/{slug}/favorite",
     auth=AuthJWT(),
@@ -45,41 +52,143 @@ def favorite(request, slug: str):
     tags=["articles"],
 )
 def unfavorite(request, slug: str) -> dict:
-    article = get_object_or_404(Article.objects.with_favorites(request.user), slug=slug)
-    get_object_or_404(article.favorites, id=request.user.id)
-    article.favorites.remove(request.user.id)
-    article = get_object_or_404(Article.objects.with_favorites(request.user), slug=slug)
-    return {"article": ArticleOutSchema.from_orm(article, complex={"request": request})}
+    return _set_favorite(request, slug, Article.objects.remove_favorite, False)
 
 
-@router.get("/articles/feed", response={200: Any, 404: Any})
-def feed(request) -> dict:
-    followed_authors = User.objects.filter(followers=request.user)
-    articles = list(
+def _set_favorite(request, slug: str, operation, favorited: bool) -> dict:
+    entry = article_cache.get_entry(request, slug)
+    try:
+        _, favorites_count = operation(entry["id"], request.user)
+    except (IntegrityError, Article.DoesNotExist):
+        article_cache.invalidate(slug)
+        raise Http404
+    # The entry holds no favorites, so it stays valid.
+    return {
+        "article": article_cache.overlay(request, entry, favorites_count, favorited)
+    }
+
+
+@router.get("/articles/feed", auth=AuthJWT(), response={200: Any, 400: Any, 401: Any})
+def feed(
+    request,
+    limit: int = Query(
+        settings.ARTICLES_PAGE_SIZE, ge=1, le=settings.ARTICLES_MAX_PAGE_SIZE
+    ),
+    cursor: Optional[str] = None,
+    stream: bool = False,
+) -> dict:
+    entries = TimelineEntry.objects.filter(
+        user=request.user, article__deleted_at__isnull=True
+    )
+    keys = ("created_at", "article_id")
+    try:
+        if stream:
+            return stream_json(
+                request,
+                {"articlesCount": count(entries, f"feed:count:{request.user.id}")},
+                "articles",
+                _stream_feed(request, after_cursor(entries, cursor, keys)),
+            )
+        page, next_cursor = paginate(entries, cursor, limit, keys=keys)
+    except InvalidCursor:
+        return 400, {"detail": [{"msg": "invalid cursor"}]}
+    return {
+        "articlesCount": count(entries, f"feed:count:{request.user.id}"),
+        "articles": _articles_by_id(request, [e.article_id for e in page]),
+        "nextCursor": next_cursor,
+    }
+
+
+def _articles_by_id(request, article_ids: list[int]) -> list[dict]:
+    rows = (
         Article.objects.with_favorites(request.user)
-        .filter(author__in=followed_authors)
-        .order_by("-created_at")
+        .filter(id__in=article_ids)
+        .values(*ARTICLE_FIELDS)
     )
+    by_id = {row["id"]: row for row in rows}
+    return project_articles(request, [by_id[pk] for pk in article_ids if pk in by_id])
+
+
+def _stream_feed(request, entries) -> Iterator[list]:
+    article_ids = entries.values_list("article_id", flat=True)
+    chunk_size = settings.ARTICLES_STREAM_CHUNK_SIZE
+    for chunk in chunked(article_ids.iterator(chunk_size=chunk_size), chunk_size):
+        yield _articles_by_id(request, chunk)
+
+
+@router.get(
+    "/articles/search", auth=AuthJWT(pass_even=True), response={200: Any, 400: Any}
+)
+def search_articles(
+    request,
+    q: str = Query(..., min_length=1),
+    limit: int = Query(
+        settings.ARTICLES_PAGE_SIZE, ge=1, le=settings.ARTICLES_MAX_PAGE_SIZE
+    ),
+    cursor: Optional[str] = None,
+) -> Any:
+    try:
+        ids, next_cursor = search.search(q, cursor, limit)
+    except InvalidCursor:
+        return 400, {"detail": [{"msg": "invalid cursor"}]}
     return {
-        "articlesCount": len(articles),
-        "articles": [
-            ArticleOutSchema.from_orm(a, context={"request": request}) for a in articles
-        ],
+        "articlesCount": search.count(q),
+        "articles": _articles_by_id(request, ids),
+        "nextCursor": next_cursor,
     }
 
 
-@router.get("/articles", response={200: Any})
-def list_articles(request) -> Any:
+@router.get("/articles", auth=AuthJWT(pass_even=True), response={200: Any, 400: Any})
+def list_articles(
+    request,
+    limit: int = Query(
+        settings.ARTICLES_PAGE_SIZE, ge=1, le=settings.ARTICLES_MAX_PAGE_SIZE
+    ),
+    cursor: Optional[str] = None,
+    tag: Optional[str] = None,
+    author: Optional[str] = None,
+    favorited: Optional[str] = None,
+    stream: bool = False,
+) -> Any:
+    filters = {"tag": tag, "author": author, "favorited": favorited}
+    articles = ArticleFilter(
+        filters, queryset=Article.objects.with_favorites(request.user)
+    ).qs.values(*ARTICLE_FIELDS)
+    try:
+        if stream:
+            return stream_json(
+                request,
+                {
+                    "articlesCount": count(
+                        articles, count_key("articles:count", **filters)
+                    )
+                },
+                "articles",
+                _stream_articles(request, after_cursor(articles, cursor)),
+            )
+        page, next_cursor = paginate(articles, cursor, limit)
+    except InvalidCursor:
+        return 400, {"detail": [{"msg": "invalid cursor"}]}
     return {
-        "articles": [
-            ArticleOutSchema.from_orm(a, context={"request": request})
-            for a in Article.objects.with_favorites(request.user).all()
-        ]
+        "articlesCount": count(articles, count_key("articles:count", **filters)),
+        "articles": project_articles(request, page),
+        "nextCursor": next_cursor,
     }
 
 
+def _stream_articles(request, articles) -> Iterator[list]:
+    chunk_size = settings.ARTICLES_STREAM_CHUNK_SIZE
+    for chunk in chunked(articles.iterator(chunk_size=chunk_size), chunk_size):
+        yield project_articles(request, chunk)
+
+
 @router.post("/articles", auth=AuthJWT(), response={201: Any, 409: Any, 422: Any})
 def create_article(request, data: ArticleCreateSchema) -> Any:
+    conflict = uniqueness.taken(
+        Article, title=data.article.title, slug=article_slug(data.article.title)
+    )
+    if conflict:
+        return 409, {"already_existing": conflict}
     with transaction.atomic():
         try:
             article = Article.objects.create(
@@ -89,23 +198,55 @@ def create_article(request, data: ArticleCreateSchema) -> Any:
         except IntegrityError as error:
             return 409, {"already_existing": clean_integrity_error(error)}
         if data.article.tags != EMPTY:
-            for tag in data.article.tags:
-                article.tags.add(tag)
-        article.save()
-    article = get_object_or_404(
-        Article.objects.with_favorites(request.user), id=article.id
-    )
-    return 201, {
-        "article": ArticleOutSchema.from_orm(article, complex={"request": request})
-    }
+            add_tags(article, data.article.tags)
+        timeline.fan_out(article)
+    article.is_favorite = False
+    return 201, {"article": serialize_articles(request, [article])[0]}
+
+
+@router.post("/articles/import", auth=AuthJWT(), response={200: Any, 401: Any})
+def import_articles(
+    request: HttpRequest,
+    batch_size: int = Query(settings.ARTICLES_IMPORT_BATCH_SIZE, ge=1, le=10000),
+) -> Any:
+    # The body is NDJSON and is read line by line straight off the request
+    # stream, so it is not declared as a schema.
+    report = importer.import_articles(request, request.user, batch_size)
+    return {"created": report.created, "failed": report.failed, "errors": report.errors}
 
 
 @router.get(
     "/articles/{slug}", auth=AuthJWT(pass_even=True), response={200: Any, 201: Any}
 )
-def retrieve_article(request, slug: str) -> Any:
-    article = get_object_or_404(Article.objects.with_favorites(request.user), slug=slug)
-    return {"article": ArticleOutSchema.from_orm(article, complex={"request": request})}
+def retrieve_article(request, slug: str, response: HttpResponse) -> Any:
+    probe = article_cache.validators(request, slug)
+    # Only the ETag decides: Last-Modified does not move with favorites.
+    not_modified = get_conditional_response(request, etag=probe.etag)
+    if not_modified is not None:
+        return article_cache.set_validators(
+            not_modified, probe.etag, probe.last_modified
+        )
+    article_cache.set_validators(response, probe.etag, probe.last_modified)
+    entry = article_cache.get_entry(request, slug)
+    views.hit(entry["id"])
+    return {
+        "article": article_cache.overlay(
+            request,
+            entry,
+            probe.favorites_count,
+            probe.favorited,
+            probe.following,
+            probe.views_count,
+        )
+    }
+
+
+@router.get("/articles/{slug}/html", response={200: Any, 404: Any})
+def retrieve_article_html(request, slug: str) -> HttpResponse:
+    article = get_object_or_404(
+        Article.objects.only("content", "content_html", "content_hash"), slug=slug
+    )
+    return HttpResponse(article.as_markdown(), content_type="text/html; charset=utf-8")
 
 
 @router.delete(
@@ -117,29 +258,49 @@ def destroy(request, slug: str) -> Any:
     article = get_object_or_404(Article, slug=slug)
     if request.user != article.author:
         return 403, None
-    article.delete()
+    deletion.soft_delete(article)
+    article_cache.invalidate(slug)
     return 204, None
 
 
 @router.put(
     "/articles/{slug}",
     auth=AuthJWT(),
-    response={200: Any, 404: Any, 403: Any, 401: Any},
+    response={200: Any, 404: Any, 403: Any, 401: Any, 412: Any},
 )
 def update_article(
-    request: HttpRequest, slug: str, data: ArticlePartialUpdateSchema
+    request: HttpRequest,
+    slug: str,
+    data: ArticlePartialUpdateSchema,
+    response: HttpResponse,
 ) -> dict:
-    article = get_object_or_404(Article.objects.with_favorites(request.user), slug=slug)
-    if request.user != article.author:
-        return 403, None
-    updated_fields = []
-    for attr, value in data.article.dict(exclude_unset=True).items():
-        setattr(article, attr, value)
-        updated_fields.extend(["title", "slug"] if attr == "title" else [attr])
-    article.save(update_fields=updated_fields)
-    return {"article": ArticleOutSchema.from_orm(article, complex={"request": request})}
+    with transaction.atomic():
+        # Only the article row; the probe's author join must not lock the user.
+        locked = Article.objects.select_for_update(of=("self",))
+        article = get_object_or_404(locked.with_favorites(request.user), slug=slug)
+        if request.user != article.author:
+            return 403, None
+        probe = article_cache.validators(request, slug, locked)
+        precondition_failed = get_conditional_response(request, etag=probe.etag)
+        if precondition_failed is not None:
+            # Tells the client which version to retry against.
+            return article_cache.set_validators(
+                precondition_failed, probe.etag, probe.last_modified
+            )
+        updated_fields = ["updated_at"]
+        for attr, value in data.article.dict(exclude_unset=True).items():
+            setattr(article, attr, value)
+            updated_fields.extend(["title", "slug"] if attr == "title" else [attr])
+        article.save(update_fields=updated_fields)
+    article_cache.invalidate(slug, article.slug)
+    probe = article_cache.validators(request, article.slug)
+    article_cache.set_validators(response, probe.etag, probe.last_modified)
+    return {"article": serialize_articles(request, [article])[0]}
 
 
 @router.get("/tags", response={200: Any})
-def list_tags(request: HttpRequest) -> Any:
-    return {"tags", [t.name for t in Tag.objects.all()]}
+def list_tags(
+    request: HttpRequest,
+    limit: int = Query(20, ge=1, le=settings.POPULAR_TAGS_MAX),
+) -> Any:
+    return {"tags": popular_tags(limit)}
@@ -0,0 +1,165 @@
+from copy import deepcopy
+from datetime import datetime
+from hashlib import sha1
+from typing import NamedTuple
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef, Value
+from django.db.models.signals import m2m_changed, post_save
+from django.dispatch import receiver
+from django.http import Http404, HttpRequest, HttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import patch_vary_headers
+from django.utils import timezone
+from django.utils.http import http_date
+
+from accounts.follows import followees
+from accounts.models import User
+from articles.loaders import serialize_articles
+from articles.models import Article
+
+
+def cache_key(slug: str) -> str:
+    return f"article:{slug}"
+
+
+def invalidate(*slugs: str) -> None:
+    cache.delete_many([cache_key(slug) for slug in slugs])
+
+
+def get_entry(request: HttpRequest, slug: str) -> dict:
+    """Viewer-independent rendering of an article, cached under its slug.
+
+    Favorites are left to `overlay`, so favoriting does not invalidate it.
+    """
+    entry = cache.get(cache_key(slug))
+    if entry is None:
+        anonymous = AnonymousUser()
+        article = get_object_or_404(
+            Article.objects.with_favorites(anonymous), slug=slug
+        )
+        (rendered,) = serialize_articles(request, [article], viewer=anonymous)
+        entry = {
+            "id": article.id,
+            "author_id": article.author_id,
+            "article": rendered.model_dump(),
+        }
+        cache.set(cache_key(slug), entry, settings.ARTICLE_CACHE_TIMEOUT)
+    return entry
+
+
+def overlay(
+    request: HttpRequest,
+    entry: dict,
+    favorites_count: int,
+    favorited: bool | None = None,
+    following: bool | None = None,
+    views_count: int | None = None,
+) -> dict:
+    """Apply the current favorites and the viewer-specific fields to an entry.
+
+    The caller passes the favorites count it already read or wrote, and the
+    viewer's favorite and follow state when known; otherwise those are
+    looked up. The cached views count is kept unless a current one is given.
+    """
+    article = deepcopy(entry["article"])
+    article["favoritesCount"] = favorites_count
+    if views_count is not None:
+        article["viewsCount"] = views_count
+    viewer = request.user
+    if viewer.is_authenticated:
+        if favorited is None:
+            favorited = Article.favorites.through.objects.filter(
+                article_id=entry["id"], user=viewer
+            ).exists()
+        article["favorited"] = favorited
+        if following is None:
+            following = entry["author_id"] in followees(viewer)
+        article["author"]["following"] = following
+    return article
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: datetime
+    # Read by the same probe and reused by `overlay`.
+    favorites_count: int
+    favorited: bool
+    following: bool
+    views_count: int
+
+
+def validators(request: HttpRequest, slug: str, queryset=None) -> Validators:
+    """ETag and Last-Modified of the article as rendered for `request.user`.
+
+    A single probe query covers every field that varies between versions of
+    the rendering: the article's own timestamp (also moved by tag changes),
+    its favorites, the author's profile and the viewer's favorite and follow
+    state. The views count is read too but left out of the ETag: views do not
+    change the article, and counting one would defeat every revalidation.
+    """
+    viewer = request.user
+    queryset = Article.objects if queryset is None else queryset
+    if viewer.is_authenticated:
+        # Read from the database, not `followees()`, so a 304 never confirms
+        # a follow state that has since changed.
+        following = Exists(
+            User.following.through.objects.filter(
+                from_user_id=viewer.pk, to_user_id=OuterRef("author_id")
+            )
+        )
+    else:
+        following = Value(False)
+    row = (
+        queryset.with_favorites(viewer)
+        .annotate(is_following=following)
+        .filter(slug=slug)
+        .values_list(
+            "id",
+            "updated_at",
+            "favorites_count",
+            "is_favorite",
+            "author_id",
+            "author__username",
+            "author__bio",
+            "author__image",
+            "is_following",
+            "views_count",
+        )
+        .first()
+    )
+    if row is None:
+        raise Http404
+    *versioned, views_count = row
+    digest = sha1(repr(tuple(versioned)).encode()).hexdigest()
+    return Validators(
+        f'"{digest}"', row[1], row[2], bool(row[3]), bool(row[8]), views_count
+    )
+
+
+def set_validators(response: HttpResponse, etag: str, last_modified: datetime):
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified.timestamp())
+    patch_vary_headers(response, ["Authorization"])
+    return response
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def invalidate_on_tags_changed(sender, instance, action, **kwargs):
+    if action.startswith("post_") and isinstance(instance, Article):
+        Article.objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+        invalidate(instance.slug)
+
+
+# Author columns embedded in cached renderings through `ProfileSchema`.
+AUTHOR_FIELDS = {"username", "bio", "image"}
+
+
+@receiver(post_save, sender=User)
+def invalidate_on_profile_changed(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or AUTHOR_FIELDS & set(update_fields):
+        invalidate(
+            *Article.objects.filter(author=instance).values_list("slug", flat=True)
+        )
@@ -0,0 +1,66 @@
+import atexit
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db import DatabaseError, models
+
+from articles.models import Article
+from helpers.writebehind import WriteBehind
+
+
+class ViewCounter(WriteBehind):
+    """Write-behind buffer of article views.
+
+    Hits are summed in memory and written with a few batched UPDATEs once
+    `ARTICLE_VIEWS_FLUSH_EVENTS` hits have accumulated, on the first hit
+    `ARTICLE_VIEWS_FLUSH_INTERVAL` seconds after the last flush, and at
+    interpreter exit. With `background=True` a daemon thread also flushes
+    every interval, so an idle worker's hits are written too. A failed write
+    keeps the hits for the next flush and never fails the request; a crashed
+    worker loses at most one buffer of hits.
+    """
+
+    interval_setting = "ARTICLE_VIEWS_FLUSH_INTERVAL"
+    background_setting = "ARTICLE_VIEWS_FLUSH_IN_BACKGROUND"
+    description = "article views"
+
+    def __init__(self, background: bool = False):
+        super().__init__(background)
+        self._pending: Counter = Counter()
+        self._events = 0
+        self._flushed_at = time.monotonic()
+
+    def hit(self, article_id: int) -> None:
+        with self._lock:
+            self._pending[article_id] += 1
+            self._events += 1
+            due = (
+                self._events >= settings.ARTICLE_VIEWS_FLUSH_EVENTS
+                or time.monotonic() - self._flushed_at >= self._interval()
+            )
+        self._start_background()
+        if due:
+            self.flush_quietly()
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+            self._events = 0
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return 0
+        try:
+            for delta in set(pending.values()):
+                Article.all_objects.filter(
+                    pk__in=[pk for pk, n in pending.items() if n == delta]
+                ).update(views_count=models.F("views_count") + delta)
+        except DatabaseError:
+            with self._lock:
+                self._pending.update(pending)
+            raise
+        return sum(pending.values())
+
+
+views = ViewCounter(background=True)
+atexit.register(views.flush_quietly)
@@ -0,0 +1,57 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models, transaction
+from django.utils import timezone
+
+from articles import search
+from articles.models import Article
+from articles.tags import shift_usage
+
+
+def soft_delete(article: Article) -> None:
+    """Hide `article` from every read at once; `purge` removes it later."""
+    with transaction.atomic():
+        Article.objects.filter(pk=article.pk).update(deleted_at=timezone.now())
+        shift_usage(article.tags.values_list("id", flat=True), -1)
+    search.unindex(article.pk)
+
+
+def purge(batch_size: int) -> int:
+    """Delete tombstoned articles, their dependent rows `batch_size` at a time.
+
+    Every chunk is its own short transaction, so no lock is held for long
+    however many comments, favorites or timeline entries an article has.
+    """
+    tombstones = Article.all_objects.filter(deleted_at__isnull=False)
+    purged = 0
+    for article_id in list(
+        tombstones.order_by("deleted_at").values_list("id", flat=True)
+    ):
+        for dependents in _dependents(article_id):
+            _delete_in_chunks(dependents, batch_size)
+        purged += (
+            tombstones.filter(pk=article_id).delete()[1].get(Article._meta.label, 0)
+        )
+    return purged
+
+
+def _dependents(article_id: int) -> list[models.QuerySet]:
+    # Reverse foreign keys (comments, timeline entries, ...), then the
+    # favorites and tags tables, which are not reverse relations of Article.
+    reverse = [
+        relation.related_model._base_manager.filter(**{relation.field.name: article_id})
+        for relation in Article._meta.related_objects
+        if relation.one_to_many and relation.on_delete is models.CASCADE
+    ]
+    return reverse + [
+        Article.favorites.through.objects.filter(article_id=article_id),
+        Article.tags.through.objects.filter(
+            content_type=ContentType.objects.get_for_model(Article),
+            object_id=article_id,
+        ),
+    ]
+
+
+def _delete_in_chunks(queryset: models.QuerySet, batch_size: int) -> None:
+    while pks := list(queryset.values_list("pk", flat=True)[:batch_size]):
+        with transaction.atomic():
+            queryset.model._base_manager.filter(pk__in=pks).delete()
@@ -0,0 +1,125 @@
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from django.conf import settings
+from django.db import IntegrityError, models, transaction
+from pydantic import ValidationError
+
+from accounts.models import User
+from articles import search, timeline
+from articles.models import Article, article_slug
+from articles.schemas import ArticleInCreateSchema
+from articles.tags import tag_articles
+from helpers import uniqueness
+from helpers.empty import EMPTY
+from helpers.exceptions import clean_integrity_error
+
+
+@dataclass
+class ImportReport:
+    created: int = 0
+    failed: int = 0
+    errors: list[dict] = field(default_factory=list)
+
+    def fail(self, line: int, msg: str) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.ARTICLES_IMPORT_MAX_ERRORS:
+            self.errors.append({"line": line, "msg": msg})
+
+
+def import_articles(
+    lines: Iterable[bytes | str], author: User, batch_size: int
+) -> ImportReport:
+    """Create articles from NDJSON lines, one `ArticleInCreateSchema` per line.
+
+    Lines are consumed lazily and written `batch_size` at a time, so the
+    input is never held in memory as a whole.
+    """
+    report = ImportReport()
+    batch = []
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            batch.append((number, ArticleInCreateSchema.model_validate_json(line)))
+        except ValidationError as error:
+            report.fail(number, _format_errors(error))
+            continue
+        if len(batch) >= batch_size:
+            _write_batch(batch, author, report)
+            batch = []
+    if batch:
+        _write_batch(batch, author, report)
+    return report
+
+
+def _format_errors(error: ValidationError) -> str:
+    return "; ".join(
+        (
+            ".".join(str(loc) for loc in e["loc"]) + f": {e['msg']}"
+            if e["loc"]
+            else e["msg"]
+        )
+        for e in error.errors()
+    )
+
+
+def _write_batch(
+    batch: list[tuple[int, ArticleInCreateSchema]], author: User, report: ImportReport
+) -> None:
+    title_probe = uniqueness.probe(Article, "title")
+    slug_probe = uniqueness.probe(Article, "slug")
+    candidates = [
+        (data.title, article_slug(data.title))
+        for _, data in batch
+        if title_probe.might_exist(data.title)
+        or slug_probe.might_exist(article_slug(data.title))
+    ]
+    taken = []
+    if candidates:
+        taken = Article.objects.filter(
+            models.Q(title__in=[title for title, _ in candidates])
+            | models.Q(slug__in=[slug for _, slug in candidates])
+        ).values_list("title", "slug")
+        taken = list(taken)
+    titles = {title for title, _ in taken}
+    slugs = {slug for _, slug in taken}
+
+    tagged = []
+    lines = []
+    for number, data in batch:
+        slug = article_slug(data.title)
+        if data.title in titles or slug in slugs:
+            report.fail(number, "already_existing: title")
+            continue
+        titles.add(data.title)
+        slugs.add(slug)
+        article = Article(
+            author=author,
+            title=data.title,
+            summary=data.summary,
+            content=data.content,
+            slug=slug,
+        )
+        article.refresh_content_html()
+        tagged.append((article, [] if data.tags == EMPTY else data.tags))
+        lines.append(number)
+
+    if not tagged:
+        return
+    try:
+        with transaction.atomic():
+            articles = Article.objects.bulk_create([a for a, _ in tagged])
+            tag_articles(tagged)
+            search.index(*articles)
+            timeline.fan_out(*articles)
+    except IntegrityError as error:
+        # Lost a race with a concurrent writer; the whole batch was rolled back.
+        for number in lines:
+            report.fail(number, f"already_existing: {clean_integrity_error(error)}")
+        return
+    # bulk_create() sends no post_save, so the probes (and above, the search
+    # index) are told directly.
+    title_probe.add(*(article.title for article in articles))
+    slug_probe.add(*(article.slug for article in articles))
+    report.created += len(articles)
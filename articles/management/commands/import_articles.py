@@ -0,0 +1,41 @@
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Q
+
+from accounts.models import User
+from articles.importer import import_articles
+
+
+class Command(BaseCommand):
+    help = "Import articles from an NDJSON file, one article per line."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help='NDJSON file to read, or "-" for stdin.')
+        parser.add_argument(
+            "--author", required=True, help="Email or username of the author."
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.ARTICLES_IMPORT_BATCH_SIZE
+        )
+
+    def handle(self, *args, **options):
+        try:
+            author = User.objects.get(
+                Q(email=options["author"]) | Q(username=options["author"])
+            )
+        except User.DoesNotExist:
+            raise CommandError(f"Unknown author {options['author']!r}.")
+
+        if options["path"] == "-":
+            report = import_articles(sys.stdin.buffer, author, options["batch_size"])
+        else:
+            with open(options["path"], "rb") as lines:
+                report = import_articles(lines, author, options["batch_size"])
+
+        for error in report.errors:
+            self.stderr.write(f"line {error['line']}: {error['msg']}")
+        self.stdout.write(
+            f"Imported {report.created} article(s), {report.failed} failed."
+        )
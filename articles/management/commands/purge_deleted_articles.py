@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from articles.deletion import purge
+
+
+class Command(BaseCommand):
+    help = "Remove soft-deleted articles and their dependent rows in small chunks."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        purged = purge(options["batch_size"])
+        self.stdout.write(f"Purged {purged} article(s).")
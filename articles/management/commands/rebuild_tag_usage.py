@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from articles.tags import rebuild_usage
+
+
+class Command(BaseCommand):
+    help = "Recompute tag usage counters from the tagged articles."
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"Rebuilt usage of {rebuild_usage()} tag(s).")
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from accounts.models import User
+from articles import timeline
+from articles.models import TimelineEntry
+
+
+class Command(BaseCommand):
+    help = "Rebuild every user's feed timeline from the follow graph."
+
+    def handle(self, *args, **options):
+        TimelineEntry.objects.all().delete()
+        follows = User.following.through.objects.select_related("from_user", "to_user")
+        for follow in follows.iterator():
+            timeline.backfill(follow.from_user, follow.to_user)
+        self.stdout.write("Timelines rebuilt.")
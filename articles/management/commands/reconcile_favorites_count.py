@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+from django.db import models
+from django.db.models.functions import Coalesce
+
+from articles.models import Article
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute Article.favorites_count where it drifted from the favorites table."
+    )
+
+    def handle(self, *args, **options):
+        favorites = (
+            Article.favorites.through.objects.filter(article=models.OuterRef("pk"))
+            .order_by()
+            .values("article")
+            .annotate(total=models.Count("*"))
+            .values("total")
+        )
+        actual = Coalesce(models.Subquery(favorites), 0)
+        updated = (
+            Article.objects.annotate(actual=actual)
+            .exclude(favorites_count=models.F("actual"))
+            .update(favorites_count=actual)
+        )
+        self.stdout.write(f"Reconciled {updated} article(s).")
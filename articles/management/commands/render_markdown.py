@@ -0,0 +1,45 @@
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand
+
+from articles.models import Article
+from articles.rendering import content_hash, render_markdown
+
+
+class Command(BaseCommand):
+    help = "Re-render Article.content_html for articles whose rendering is stale."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--all", action="store_true", help="Re-render every article."
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--workers", type=int, default=None, help="Defaults to the CPU count."
+        )
+
+    def handle(self, *args, **options):
+        rows = Article.objects.values_list("id", "content", "content_hash")
+        rendered = 0
+        with ProcessPoolExecutor(max_workers=options["workers"]) as pool:
+            batch = []
+            for row in rows.iterator(chunk_size=options["batch_size"]):
+                pk, content, digest = row
+                if options["all"] or digest != content_hash(content):
+                    batch.append((pk, content))
+                if len(batch) >= options["batch_size"]:
+                    rendered += self._render(pool, batch)
+                    batch = []
+            if batch:
+                rendered += self._render(pool, batch)
+        self.stdout.write(f"Rendered {rendered} article(s).")
+
+    def _render(self, pool: ProcessPoolExecutor, batch: list[tuple]) -> int:
+        contents = [content for _, content in batch]
+        articles = [
+            Article(id=pk, content_html=html, content_hash=content_hash(content))
+            for (pk, content), html in zip(
+                batch, pool.map(render_markdown, contents, chunksize=16)
+            )
+        ]
+        return Article.objects.bulk_update(articles, ["content_html", "content_hash"])
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:50
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_favorites_count(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    favorites = (
+        Article.favorites.through.objects.filter(article=models.OuterRef("pk"))
+        .order_by()
+        .values("article")
+        .annotate(total=models.Count("*"))
+        .values("total")
+    )
+    Article.objects.update(favorites_count=Coalesce(models.Subquery(favorites), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0002_article_article_created_at_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="favorites_count",
+            field=models.PositiveIntegerField(
+                default=0, help_text="Denormalized number of favorites"
+            ),
+        ),
+        migrations.RunPython(backfill_favorites_count, migrations.RunPython.noop),
+    ]
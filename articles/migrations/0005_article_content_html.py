@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0004_timelineentry"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="content_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Hash of the rendering",
+                max_length=64,
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="content_html",
+            field=models.TextField(
+                blank=True, editable=False, help_text="Rendered markdown of the content"
+            ),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.18 on 2026-10-17 19:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_tag_usage(apps, schema_editor):
+    TaggedItem = apps.get_model("taggit", "TaggedItem")
+    TagUsage = apps.get_model("articles", "TagUsage")
+    counts = (
+        TaggedItem.objects.filter(
+            content_type__app_label="articles", content_type__model="article"
+        )
+        .values("tag_id")
+        .annotate(total=models.Count("*"))
+    )
+    TagUsage.objects.bulk_create(
+        [TagUsage(tag_id=row["tag_id"], count=row["total"]) for row in counts]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0005_article_content_html"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TagUsage",
+            fields=[
+                (
+                    "tag",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="usage",
+                        serialize=False,
+                        to="taggit.tag",
+                    ),
+                ),
+                (
+                    "count",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Number of articles tagged with this tag"
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["-count"], name="tag_usage_count_idx")
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_tag_usage, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+SQLITE = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS articles_article_search "
+    "USING fts5(title, summary, content, tokenize='porter unicode61')",
+    "INSERT INTO articles_article_search (rowid, title, summary, content) "
+    "SELECT id, title, summary, content FROM articles_article",
+]
+POSTGRESQL = [
+    "CREATE TABLE IF NOT EXISTS articles_article_search "
+    "(article_id bigint PRIMARY KEY, document tsvector NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS articles_article_search_document_idx "
+    "ON articles_article_search USING GIN (document)",
+    "INSERT INTO articles_article_search (article_id, document) "
+    "SELECT id, "
+    "setweight(to_tsvector('english', title), 'A') || "
+    "setweight(to_tsvector('english', summary), 'B') || "
+    "setweight(to_tsvector('english', content), 'C') "
+    "FROM articles_article",
+]
+
+
+def create_search_index(apps, schema_editor):
+    statements = {"sqlite": SQLITE, "postgresql": POSTGRESQL}
+    for statement in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(statement)
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor in ("sqlite", "postgresql"):
+        schema_editor.execute("DROP TABLE IF EXISTS articles_article_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0006_tagusage"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
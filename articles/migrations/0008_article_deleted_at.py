@@ -0,0 +1,37 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:13
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0007_article_search"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="deleted_at",
+            field=models.DateTimeField(
+                blank=True,
+                editable=False,
+                help_text="Tombstone; the row and its dependents are purged later",
+                null=True,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                condition=models.Q(("deleted_at__isnull", False)),
+                fields=["deleted_at"],
+                name="article_tombstone_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0008_article_deleted_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="views_count",
+            field=models.PositiveBigIntegerField(
+                default=0, help_text="Number of views, written behind in batches"
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+RESERVED_SLUGS = ("feed", "import", "search")
+
+
+def rename_reserved_slugs(apps, schema_editor):
+    Article = apps.get_model("articles", "Article")
+    for slug in RESERVED_SLUGS:
+        Article.objects.using(schema_editor.connection.alias).filter(slug=slug).update(
+            slug=f"{slug}-article"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0009_article_views_count"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_reserved_slugs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.18 on 2026-10-17 20:57
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("articles", "0010_reserved_slugs"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="article",
+            name="slug",
+            field=models.SlugField(
+                blank=True, help_text="Slug of the article", max_length=255
+            ),
+        ),
+        migrations.AlterField(
+            model_name="article",
+            name="title",
+            field=models.CharField(
+                blank=True, help_text="Title of the article", max_length=255
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="article",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("title",),
+                name="article_live_title_uniq",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="article",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("deleted_at__isnull", True)),
+                fields=("slug",),
+                name="article_live_slug_uniq",
+            ),
+        ),
+    ]
@@ -1,19 +1,28 @@
-import markdown
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import AnonymousUser
-from django.db import models
+from django.db import connections, models, transaction
 from django.utils.text import slugify
 from taggit.managers import TaggableManager
+from taggit.models import Tag
+
+from articles.rendering import content_hash, is_current, render_markdown
 
 User = get_user_model()
 
+# Fixed routes under /articles/ that an article slug would shadow.
+RESERVED_SLUGS = frozenset({"feed", "import", "search"})
+
+
+def article_slug(title: str) -> str:
+    slug = slugify(title)
+    return f"{slug}-article" if slug in RESERVED_SLUGS else slug
+
 
 class ArticleQuerySet(models.QuerySet):
 
     def with_favorites(self, user: AnonymousUser | User) -> models.QuerySet:
         return self.annotate(
-            num_favorites=models.Count("favorites", distinct=True),
             is_favorite=(
                 models.Exists(
                     User.objects.filter(pk=user.id, favorites=models.OuterRef("pk"))
@@ -23,17 +32,84 @@ class ArticleQuerySet(models.QuerySet):
             ),
         )
 
+    def add_favorite(self, article_id: int, user: User) -> tuple[bool, int]:
+        """Idempotently favorite an article; returns (changed, favorites count)."""
+        connection = self._write_connection()
+        through = self.model.favorites.through
+        article_field = through._meta.get_field("article")
+        user_field = through._meta.get_field("user")
+        quote = connection.ops.quote_name
+        with transaction.atomic(using=connection.alias), connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {quote(through._meta.db_table)} "
+                f"({quote(article_field.column)}, {quote(user_field.column)}) "
+                "VALUES (%s, %s) ON CONFLICT DO NOTHING",
+                [
+                    article_field.get_db_prep_value(article_id, connection),
+                    user_field.get_db_prep_value(user.pk, connection),
+                ],
+            )
+            added = cursor.rowcount == 1
+            return added, self._shift_favorites_count(article_id, int(added))
+
+    def remove_favorite(self, article_id: int, user: User) -> tuple[bool, int]:
+        """Idempotently unfavorite an article; returns (changed, favorites count)."""
+        connection = self._write_connection()
+        with transaction.atomic(using=connection.alias):
+            deleted, _ = (
+                self.model.favorites.through.objects.using(connection.alias)
+                .filter(article_id=article_id, user=user)
+                .delete()
+            )
+            return bool(deleted), self._shift_favorites_count(article_id, -deleted)
+
+    def _write_connection(self):
+        self._for_write = True
+        return connections[self.db]
+
+    def _shift_favorites_count(self, article_id: int, delta: int) -> int:
+        if not delta:
+            return (
+                self.filter(pk=article_id)
+                .values_list("favorites_count", flat=True)
+                .get()
+            )
+        connection = self._write_connection()
+        meta = self.model._meta
+        quote = connection.ops.quote_name
+        column = quote(meta.get_field("favorites_count").column)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {quote(meta.db_table)} SET {column} = {column} + %s "
+                f"WHERE {quote(meta.pk.column)} = %s RETURNING {column}",
+                [delta, meta.pk.get_db_prep_value(article_id, connection)],
+            )
+            row = cursor.fetchone()
+        if row is None:
+            raise self.model.DoesNotExist
+        return row[0]
+
 
-ArticleManager = models.Manager.from_queryset(ArticleQuerySet)
+class ArticleManager(models.Manager.from_queryset(ArticleQuerySet)):
+    """Articles that have not been deleted."""
+
+    def get_queryset(self) -> ArticleQuerySet:
+        return super().get_queryset().filter(deleted_at__isnull=True)
 
 
 class Article(models.Model):
     author = models.ForeignKey(User, on_delete=models.CASCADE)
     title = models.CharField(
-        max_length=255, unique=True, blank=True, help_text="Title of the article"
+        max_length=255, blank=True, help_text="Title of the article"
     )
     summary = models.TextField(blank=True, help_text="Summary of the article")
     content = models.TextField(blank=True, help_text="Content of the article")
+    content_html = models.TextField(
+        blank=True, editable=False, help_text="Rendered markdown of the content"
+    )
+    content_hash = models.CharField(
+        max_length=64, blank=True, editable=False, help_text="Hash of the rendering"
+    )
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
@@ -42,15 +118,117 @@ class Article(models.Model):
     favorites = models.ManyToManyField(
         settings.AUTH_USER_MODEL, blank=True, related_name="favorites"
     )
-    slug = models.SlugField(
-        max_length=255, unique=True, blank=True, help_text="Slug of the article"
+    favorites_count = models.PositiveIntegerField(
+        default=0, help_text="Denormalized number of favorites"
+    )
+    views_count = models.PositiveBigIntegerField(
+        default=0, help_text="Number of views, written behind in batches"
+    )
+    slug = models.SlugField(max_length=255, blank=True, help_text="Slug of the article")
+    deleted_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Tombstone; the row and its dependents are purged later",
     )
 
     objects = ArticleManager()
+    all_objects = models.Manager.from_queryset(ArticleQuerySet)()
+
+    class Meta:
+        # Only live articles hold their title and slug, so a deleted
+        # article's can be reused before it is purged.
+        constraints = [
+            models.UniqueConstraint(
+                fields=["title"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="article_live_title_uniq",
+            ),
+            models.UniqueConstraint(
+                fields=["slug"],
+                condition=models.Q(deleted_at__isnull=True),
+                name="article_live_slug_uniq",
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["-created_at", "-id"], name="article_created_at_id_idx"
+            ),
+            models.Index(
+                fields=["deleted_at"],
+                condition=models.Q(deleted_at__isnull=False),
+                name="article_tombstone_idx",
+            ),
+        ]
 
     def save(self, *args, **kwargs):
-        self.slug = slugify(self.title)
+        self.slug = article_slug(self.title)
+        if self.refresh_content_html() and kwargs.get("update_fields") is not None:
+            kwargs["update_fields"] = {
+                *kwargs["update_fields"],
+                "content_html",
+                "content_hash",
+            }
         super().save(*args, **kwargs)
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        article = super().from_db(db, field_names, values)
+        # Stored HTML matches the content as loaded; `as_markdown` detects
+        # later assignments by identity instead of hashing the content.
+        article._rendered_content = article.__dict__.get("content")
+        return article
+
+    def refresh_content_html(self) -> bool:
+        digest = content_hash(self.content)
+        self._rendered_content = self.content
+        if digest == self.content_hash:
+            return False
+        self.content_html = render_markdown(self.content)
+        self.content_hash = digest
+        return True
+
     def as_markdown(self) -> str:
-        return markdown.markdown(self.content, safe_mode="escape", extensions=["extra"])
+        """The stored HTML, unless the content changed since it was loaded.
+
+        Renderings from another renderer are redone on the fly. Content
+        written with `update()` keeps its old HTML until
+        `manage.py render_markdown` runs.
+        """
+        unchanged = self.content is getattr(self, "_rendered_content", None)
+        if unchanged and is_current(self.content_hash):
+            return self.content_html
+        return render_markdown(self.content)
+
+
+class TimelineEntry(models.Model):
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="timeline")
+    article = models.ForeignKey(
+        Article, on_delete=models.CASCADE, related_name="timeline_entries"
+    )
+    created_at = models.DateTimeField(help_text="Copy of the article creation date")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "article"], name="timeline_user_article_uniq"
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["user", "-created_at", "-article"],
+                name="timeline_user_created_at_idx",
+            ),
+        ]
+
+
+class TagUsage(models.Model):
+    tag = models.OneToOneField(
+        Tag, on_delete=models.CASCADE, primary_key=True, related_name="usage"
+    )
+    count = models.PositiveIntegerField(
+        default=0, help_text="Number of articles tagged with this tag"
+    )
+
+    class Meta:
+        indexes = [models.Index(fields=["-count"], name="tag_usage_count_idx")]
@@ -0,0 +1,63 @@
+import threading
+from hashlib import sha256
+
+import markdown
+from markdown.extensions import Extension
+
+
+class EscapeHtmlExtension(Extension):
+    """Render raw HTML in the source as text, like the removed `safe_mode="escape"`."""
+
+    # Bump when the output changes, to mark stored renderings stale.
+    version = 1
+
+    def extendMarkdown(self, md):
+        md.preprocessors.deregister("html_block")
+        md.inlinePatterns.deregister("html")
+
+
+MARKDOWN_EXTENSIONS = ["extra"]
+
+
+def _extensions() -> list:
+    return [*MARKDOWN_EXTENSIONS, EscapeHtmlExtension()]
+
+
+def _describe(extension) -> tuple:
+    if isinstance(extension, str):
+        return (extension,)
+    return (
+        type(extension).__qualname__,
+        getattr(extension, "version", None),
+        sorted(extension.getConfigs().items()),
+    )
+
+
+# Identifies the renderer: Markdown's version, the extensions and their
+# configuration. It prefixes every content hash, so a stored rendering made
+# by another renderer is recognized without hashing the content.
+FINGERPRINT = sha256(
+    repr((markdown.__version__, [_describe(e) for e in _extensions()])).encode()
+).hexdigest()[:16]
+
+_local = threading.local()
+
+
+def _renderer() -> markdown.Markdown:
+    renderer = getattr(_local, "renderer", None)
+    if renderer is None:
+        renderer = _local.renderer = markdown.Markdown(extensions=_extensions())
+    return renderer
+
+
+def render_markdown(text: str) -> str:
+    return _renderer().reset().convert(text)
+
+
+def content_hash(text: str) -> str:
+    """The renderer's fingerprint followed by a digest of `text`, 64 characters."""
+    return FINGERPRINT + sha256(text.encode()).hexdigest()[: 64 - len(FINGERPRINT)]
+
+
+def is_current(digest: str) -> bool:
+    return digest.startswith(FINGERPRINT)
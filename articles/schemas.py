@@ -11,11 +11,12 @@ from helpers.empty import EMPTY
 
 class ArticleOutSchema(ModelSchema):
     description: str = Field(alias="summary")
-    body: str = Field(alias="body")
+    body: str = Field(alias="content")
     createdAt: datetime = Field(alias="created_at")
     updatedAt: datetime = Field(alias="updated_at")
-    favorite: bool
-    favoriteCount: int
+    favorited: bool
+    favoritesCount: int
+    viewsCount: int
     author: ProfileSchema
     tagList: list[str]
 
@@ -24,27 +25,68 @@ class ArticleOutSchema(ModelSchema):
         fields = ["slug", "title"]
 
     @staticmethod
-    def resolve_favorite(obj) -> bool:
+    def resolve_favorited(obj) -> bool:
         return obj.is_favorite
 
     @staticmethod
-    def favorite_count(obj) -> int:
-        return obj.num_favorites
+    def resolve_favoritesCount(obj) -> int:
+        return obj.favorites_count
 
     @staticmethod
-    def resolve_tagList(obj) -> list[str]:
+    def resolve_viewsCount(obj) -> int:
+        return obj.views_count
+
+    @staticmethod
+    def resolve_tagList(obj, context) -> list[str]:
+        tags = context.get("tags") if context else None
+        if tags is not None:
+            return tags.get(obj.id, [])
         return (
             obj.tags if isinstance(obj.tags, list) else [t.name for t in obj.tags.all()]
         )
 
 
+# Columns read by `article_from_row`, the projection counterpart of
+# `ArticleOutSchema` used by the list endpoints.
+ARTICLE_FIELDS = (
+    "id",
+    "author_id",
+    "slug",
+    "title",
+    "summary",
+    "content",
+    "created_at",
+    "updated_at",
+    "favorites_count",
+    "views_count",
+    "is_favorite",
+)
+
+
+def article_from_row(row: dict, author: dict, tags: list[str]) -> dict:
+    """`ArticleOutSchema` output built straight from a `.values(*ARTICLE_FIELDS)` row."""
+    return {
+        "description": row["summary"],
+        "body": row["content"],
+        "createdAt": row["created_at"],
+        "updatedAt": row["updated_at"],
+        "favorited": bool(row["is_favorite"]),
+        "favoritesCount": row["favorites_count"],
+        "viewsCount": row["views_count"],
+        "author": author,
+        "tagList": tags,
+        "slug": row["slug"],
+        "title": row["title"],
+    }
+
+
 class ArticleInCreateSchema(Schema):
     title: str
-    summery: str = Field(alias="description")
+    summary: str = Field(alias="description")
     content: str = Field(alias="body")
     tags: SerializeAsAny[list[str]] = Field(EMPTY, alias="tagList")
 
-    @field_validator("content", "summery", "title")
+    @field_validator("content", "summary", "title")
     def check_not_empty(cls, v):
         assert v != "", "can't be blank"
         return v
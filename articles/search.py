@@ -0,0 +1,200 @@
+import re
+
+from django.db import DEFAULT_DB_ALIAS, connections, models, router
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from articles.models import Article
+from helpers.pagination import decode_cursor, encode_cursor
+
+# Inverted index over title, summary and content, keyed by article id: an FTS5
+# virtual table on SQLite, a table of weighted tsvectors with a GIN index on
+# PostgreSQL.
+INDEX_TABLE = "articles_article_search"
+INDEXED_FIELDS = {"title", "summary", "content"}
+
+_SQLITE_CREATE = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {INDEX_TABLE} "
+    "USING fts5(title, summary, content, tokenize='porter unicode61')",
+]
+_POSTGRESQL_CREATE = [
+    f"CREATE TABLE IF NOT EXISTS {INDEX_TABLE} "
+    "(article_id bigint PRIMARY KEY, document tsvector NOT NULL)",
+    f"CREATE INDEX IF NOT EXISTS {INDEX_TABLE}_document_idx "
+    f"ON {INDEX_TABLE} USING GIN (document)",
+]
+CREATE_STATEMENTS = {"sqlite": _SQLITE_CREATE, "postgresql": _POSTGRESQL_CREATE}
+_POSTGRESQL_DOCUMENT = (
+    "setweight(to_tsvector('english', %s), 'A') || "
+    "setweight(to_tsvector('english', %s), 'B') || "
+    "setweight(to_tsvector('english', %s), 'C')"
+)
+
+
+def _connection(using: str | None = None, write: bool = False):
+    if using is None:
+        using = router.db_for_write(Article) if write else router.db_for_read(Article)
+    return connections[using]
+
+
+def _indexed(connection) -> bool:
+    return connection.vendor in CREATE_STATEMENTS
+
+
+def create_index(sender=None, using=DEFAULT_DB_ALIAS, **kwargs) -> None:
+    """Create the index table if missing; also runs on `post_migrate`.
+
+    Databases built straight from the models, such as the test database,
+    never apply migration 0007 and get their index from here.
+    """
+    db = connections[using]
+    with db.cursor() as cursor:
+        for statement in CREATE_STATEMENTS.get(db.vendor, []):
+            cursor.execute(statement)
+
+
+def index(*articles: Article, using: str | None = None) -> None:
+    connection = _connection(using, write=True)
+    if not articles or not _indexed(connection):
+        return
+    unindex(*(article.id for article in articles), using=connection.alias)
+    rows = [(a.id, a.title, a.summary, a.content) for a in articles]
+    with connection.cursor() as cursor:
+        if connection.vendor == "sqlite":
+            cursor.executemany(
+                f"INSERT INTO {INDEX_TABLE} (rowid, title, summary, content) "
+                "VALUES (%s, %s, %s, %s)",
+                rows,
+            )
+        else:
+            cursor.executemany(
+                f"INSERT INTO {INDEX_TABLE} (article_id, document) "
+                f"VALUES (%s, {_POSTGRESQL_DOCUMENT})",
+                rows,
+            )
+
+
+def unindex(*article_ids: int, using: str | None = None) -> None:
+    connection = _connection(using, write=True)
+    if not article_ids or not _indexed(connection):
+        return
+    key = "rowid" if connection.vendor == "sqlite" else "article_id"
+    placeholders = ", ".join(["%s"] * len(article_ids))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"DELETE FROM {INDEX_TABLE} WHERE {key} IN ({placeholders})",
+            list(article_ids),
+        )
+
+
+def rebuild(batch_size: int = 500, using: str | None = None) -> int:
+    connection = _connection(using, write=True)
+    if not _indexed(connection):
+        return 0
+    create_index(using=connection.alias)
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {INDEX_TABLE}")
+    articles = Article.objects.using(connection.alias).only(
+        "id", "title", "summary", "content"
+    )
+    indexed = 0
+    batch = []
+    for article in articles.iterator(chunk_size=batch_size):
+        batch.append(article)
+        if len(batch) >= batch_size:
+            index(*batch, using=connection.alias)
+            indexed += len(batch)
+            batch = []
+    index(*batch, using=connection.alias)
+    return indexed + len(batch)
+
+
+def _matches(connection, words: list[str]) -> tuple[str, list]:
+    """SQL selecting `(id, score)` for the articles matching every word."""
+    if connection.vendor == "sqlite":
+        # Quoted terms are ANDed and never parsed as FTS5 query syntax.
+        match = " ".join(f'"{word}"' for word in words)
+        return (
+            f"SELECT rowid AS id, -bm25({INDEX_TABLE}, 10.0, 4.0, 1.0) AS score "
+            f"FROM {INDEX_TABLE} WHERE {INDEX_TABLE} MATCH %s",
+            [match],
+        )
+    return (
+        "SELECT article_id AS id, ts_rank(document, query)::float8 AS score "
+        f"FROM {INDEX_TABLE}, plainto_tsquery('english', %s) AS query "
+        "WHERE document @@ query",
+        [" ".join(words)],
+    )
+
+
+def _scan(connection, words: list[str]) -> models.QuerySet:
+    """Unranked `icontains` matches, for databases without a full-text index."""
+    matches = Article.objects.using(connection.alias)
+    for word in words:
+        matches = matches.filter(
+            models.Q(title__icontains=word)
+            | models.Q(summary__icontains=word)
+            | models.Q(content__icontains=word)
+        )
+    return matches
+
+
+def search(
+    query: str, cursor: str | None, limit: int, using: str | None = None
+) -> tuple[list[int], str | None]:
+    """Ids of the articles matching `query`, ranked, one page at a time.
+
+    Pages are keyed on `(score, id)` like `helpers.pagination.paginate`.
+    Without a full-text index every match scores 0, newest first.
+    """
+    words = re.findall(r"\w+", query)
+    if not words:
+        return [], None
+    connection = _connection(using)
+    if not _indexed(connection):
+        matches = _scan(connection, words).order_by("-id")
+        if cursor:
+            _, pk = decode_cursor(cursor, parse=float)
+            matches = matches.filter(id__lt=pk)
+        rows = [(pk, 0.0) for pk in matches.values_list("id", flat=True)[: limit + 1]]
+    else:
+        sql, params = _matches(connection, words)
+        sql = f"SELECT id, score FROM ({sql}) AS matches"
+        if cursor:
+            score, pk = decode_cursor(cursor, parse=float)
+            sql += " WHERE score < %s OR (score = %s AND id < %s)"
+            params += [score, score, pk]
+        sql += " ORDER BY score DESC, id DESC LIMIT %s"
+        params.append(limit + 1)
+        with connection.cursor() as db_cursor:
+            db_cursor.execute(sql, params)
+            rows = db_cursor.fetchall()
+    if len(rows) <= limit:
+        return [pk for pk, _ in rows], None
+    return [pk for pk, _ in rows[:limit]], encode_cursor(
+        rows[limit - 1][1], rows[limit - 1][0]
+    )
+
+
+def count(query: str, using: str | None = None) -> int:
+    words = re.findall(r"\w+", query)
+    if not words:
+        return 0
+    connection = _connection(using)
+    if not _indexed(connection):
+        return _scan(connection, words).count()
+    sql, params = _matches(connection, words)
+    with connection.cursor() as cursor:
+        cursor.execute(f"SELECT COUNT(*) FROM ({sql}) AS matches", params)
+        return cursor.fetchone()[0]
+
+
+@receiver(post_save, sender=Article)
+def index_on_save(sender, instance, using, update_fields=None, **kwargs):
+    if update_fields is None or INDEXED_FIELDS & set(update_fields):
+        index(instance, using=using)
+
+
+@receiver(post_delete, sender=Article)
+def unindex_on_delete(sender, instance, using, **kwargs):
+    unindex(instance.id, using=using)
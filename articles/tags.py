@@ -0,0 +1,125 @@
+from collections import Counter
+from typing import Iterable
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import models
+from django.db.models.signals import m2m_changed, pre_delete
+from django.dispatch import receiver
+from taggit.models import Tag
+
+from articles.models import Article, TagUsage
+
+POPULAR_TAGS_CACHE_KEY = "tags:popular"
+
+
+def shift_usage(tag_ids, delta: int) -> None:
+    tag_ids = list(tag_ids)
+    if not tag_ids:
+        return
+    if delta > 0:
+        TagUsage.objects.bulk_create(
+            [TagUsage(tag_id=tag_id) for tag_id in tag_ids], ignore_conflicts=True
+        )
+    TagUsage.objects.filter(tag_id__in=tag_ids, count__gte=-delta).update(
+        count=models.F("count") + delta
+    )
+
+
+def resolve_tags(names: Iterable[str]) -> dict[str, int]:
+    """Map tag names to ids, creating the missing tags in bulk."""
+    names = list(dict.fromkeys(names))
+    if not names:
+        return {}
+    tags = dict(Tag.objects.filter(name__in=names).values_list("name", "id"))
+    missing = [name for name in names if name not in tags]
+    if missing:
+        Tag.objects.bulk_create(
+            [Tag(name=name, slug=Tag().slugify(name)) for name in missing],
+            ignore_conflicts=True,
+        )
+        tags.update(Tag.objects.filter(name__in=missing).values_list("name", "id"))
+    for name in names:
+        if name not in tags:
+            # Its slug is taken by another tag; let taggit pick a suffixed one.
+            tags[name] = Tag.objects.create(name=name).id
+    return tags
+
+
+def tag_articles(tagged: list[tuple[Article, list[str]]]) -> None:
+    """Attach tags to freshly created articles with a single insert.
+
+    Usage counters are updated here rather than through `m2m_changed`.
+    """
+    tag_ids = resolve_tags(name for _, names in tagged for name in names)
+    content_type = ContentType.objects.get_for_model(Article)
+    items = {(article.id, tag_ids[name]) for article, names in tagged for name in names}
+    Article.tags.through.objects.bulk_create(
+        [
+            Article.tags.through(
+                content_type=content_type, object_id=article_id, tag_id=tag_id
+            )
+            for article_id, tag_id in items
+        ]
+    )
+    usage = Counter(tag_id for _, tag_id in items)
+    for delta in set(usage.values()):
+        shift_usage([tag_id for tag_id, n in usage.items() if n == delta], delta)
+
+
+def add_tags(article: Article, names: Iterable[str]) -> None:
+    tag_articles([(article, list(names))])
+
+
+def popular_tags(limit: int) -> list[str]:
+    names = cache.get(POPULAR_TAGS_CACHE_KEY)
+    if names is None:
+        names = list(
+            TagUsage.objects.filter(count__gt=0)
+            .order_by("-count", "tag__name")
+            .values_list("tag__name", flat=True)[: settings.POPULAR_TAGS_MAX]
+        )
+        cache.set(POPULAR_TAGS_CACHE_KEY, names, settings.POPULAR_TAGS_CACHE_TIMEOUT)
+    return names[:limit]
+
+
+def rebuild_usage() -> int:
+    counts = (
+        Article.tags.through.objects.filter(
+            content_type__app_label=Article._meta.app_label,
+            content_type__model=Article._meta.model_name,
+        )
+        .exclude(
+            object_id__in=Article.all_objects.filter(deleted_at__isnull=False).values(
+                "id"
+            )
+        )
+        .values("tag_id")
+        .annotate(total=models.Count("*"))
+    )
+    TagUsage.objects.all().delete()
+    created = TagUsage.objects.bulk_create(
+        [TagUsage(tag_id=row["tag_id"], count=row["total"]) for row in counts]
+    )
+    cache.delete(POPULAR_TAGS_CACHE_KEY)
+    return len(created)
+
+
+@receiver(m2m_changed, sender=Article.tags.through)
+def update_usage_on_tags_changed(sender, instance, action, pk_set, **kwargs):
+    if not isinstance(instance, Article):
+        return
+    if action == "post_add":
+        shift_usage(pk_set, 1)
+    elif action == "post_remove":
+        shift_usage(pk_set, -1)
+    elif action == "pre_clear":
+        shift_usage(instance.tags.values_list("id", flat=True), -1)
+
+
+@receiver(pre_delete, sender=Article)
+def update_usage_on_article_deleted(sender, instance, **kwargs):
+    # Soft-deleted articles were already taken off the counters.
+    if instance.deleted_at is None:
+        shift_usage(instance.tags.values_list("id", flat=True), -1)
@@ -0,0 +1,123 @@
+import atexit
+import time
+from typing import Iterable
+
+from django.conf import settings
+from django.db import DatabaseError, models, transaction
+
+from accounts.models import User
+from articles.models import Article, TimelineEntry
+from helpers.streaming import chunked
+from helpers.writebehind import WriteBehind
+
+
+class PendingTrims(WriteBehind):
+    """Users whose timelines a fan-out grew, trimmed in batches.
+
+    Publishing only records the followers. Their timelines are cut back to
+    `TIMELINE_MAX_LENGTH` every `TIMELINE_TRIM_INTERVAL` seconds by a daemon
+    thread, or without it by the first publish after the interval, and at
+    interpreter exit. Until then a timeline may run over by the entries
+    published meanwhile, which the feed's cursor pagination does not mind.
+    """
+
+    interval_setting = "TIMELINE_TRIM_INTERVAL"
+    background_setting = "TIMELINE_TRIM_IN_BACKGROUND"
+    description = "timeline trims"
+
+    def __init__(self, background: bool = False):
+        super().__init__(background)
+        self._pending: set = set()
+        self._flushed_at = time.monotonic()
+
+    def add(self, user_ids: Iterable) -> None:
+        with self._lock:
+            self._pending.update(user_ids)
+            due = (
+                not self._in_background()
+                and time.monotonic() - self._flushed_at >= self._interval()
+            )
+        self._start_background()
+        if due:
+            self.flush_quietly()
+
+    def flush(self) -> int:
+        with self._lock:
+            pending, self._pending = self._pending, set()
+            self._flushed_at = time.monotonic()
+        if not pending:
+            return 0
+        try:
+            trim(pending)
+        except DatabaseError:
+            with self._lock:
+                self._pending.update(pending)
+            raise
+        return len(pending)
+
+
+def fan_out(*articles: Article) -> None:
+    follows = User.following.through.objects.filter(
+        to_user_id__in={a.author_id for a in articles}
+    ).values_list("to_user_id", "from_user_id")
+    followers = {}
+    for author_id, user_id in follows:
+        followers.setdefault(author_id, []).append(user_id)
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(
+                user_id=user_id, article=article, created_at=article.created_at
+            )
+            for article in articles
+            for user_id in followers.get(article.author_id, [])
+        ],
+        ignore_conflicts=True,
+    )
+    grown = {user_id for user_ids in followers.values() for user_id in user_ids}
+    # Trimmed later, outside the publishing transaction and request.
+    transaction.on_commit(lambda: trims.add(grown))
+
+
+def backfill(user: User, author: User) -> None:
+    articles = Article.objects.filter(author=author).order_by("-created_at", "-id")
+    TimelineEntry.objects.bulk_create(
+        [
+            TimelineEntry(user=user, article_id=pk, created_at=created_at)
+            for pk, created_at in articles.values_list("id", "created_at")[
+                : settings.TIMELINE_MAX_LENGTH
+            ]
+        ],
+        ignore_conflicts=True,
+    )
+    trim([user.id])
+
+
+def prune(user: User, author: User) -> None:
+    TimelineEntry.objects.filter(user=user, article__author=author).delete()
+
+
+def trim(user_ids: Iterable) -> None:
+    max_length = settings.TIMELINE_MAX_LENGTH
+    for chunk in chunked(user_ids, settings.TIMELINE_TRIM_CHUNK):
+        overflowing = (
+            TimelineEntry.objects.filter(user_id__in=chunk)
+            .values("user_id")
+            .annotate(total=models.Count("*"))
+            .filter(total__gt=max_length)
+            .values_list("user_id", flat=True)
+        )
+        for user_id in overflowing:
+            oldest_kept = (
+                TimelineEntry.objects.filter(user_id=user_id)
+                .order_by("-created_at", "-article_id")
+                .values_list("created_at", "article_id")[max_length - 1]
+            )
+            TimelineEntry.objects.filter(
+                models.Q(created_at__lt=oldest_kept[0])
+                | models.Q(created_at=oldest_kept[0], article_id__lt=oldest_kept[1]),
+                user_id=user_id,
+            ).delete()
+
+
+trims = PendingTrims(background=True)
+atexit.register(trims.flush_quietly)
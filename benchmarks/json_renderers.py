@@ -0,0 +1,94 @@
+"""Before/after benchmark of the API's JSON renderer and parser.
+
+Renders a list-articles payload with ninja's default (stdlib json) renderer
+and with the orjson one configured in core.urls, then parses a create-article
+body with both parsers:
+
+    python -m benchmarks.json_renderers [--articles 100] [--number 200]
+"""
+
+import argparse
+import os
+import timeit
+from datetime import datetime, timedelta, timezone
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "core.settings")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.test import RequestFactory  # noqa: E402
+from ninja.parser import Parser  # noqa: E402
+from ninja.renderers import JSONRenderer  # noqa: E402
+
+from helpers.renderers import ORJSONParser, ORJSONRenderer  # noqa: E402
+
+
+def articles_payload(count: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "articlesCount": count,
+        "articles": [
+            {
+                "slug": f"article-{i}",
+                "title": f"Article {i}",
+                "description": "A summary of the article " * 4,
+                "body": "Some *markdown* content. " * 40,
+                "tagList": ["django", "ninja", f"tag{i % 10}"],
+                "createdAt": now - timedelta(minutes=i),
+                "updatedAt": now - timedelta(minutes=i // 2),
+                "favorited": i % 3 == 0,
+                "favoritesCount": i,
+                "author": {
+                    "username": f"author{i % 7}",
+                    "bio": None,
+                    "image": "https://api.realworld.io/images/smiley-cyrus.jpeg",
+                    "following": False,
+                },
+            }
+            for i in range(count)
+        ],
+        "nextCursor": "WyIyMDI2LTAxLTAxVDAwOjAwOjAwKzAwOjAwIiw0Ml0",
+    }
+
+
+def best_of(function, number: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number
+
+
+def report(name: str, before: float, after: float) -> None:
+    print(
+        f"{name:<8} stdlib {before * 1e6:9.1f} us   orjson {after * 1e6:9.1f} us"
+        f"   x{before / after:.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--articles", type=int, default=100)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    payload = articles_payload(args.articles)
+    stdlib, fast = JSONRenderer(), ORJSONRenderer()
+    report(
+        "render",
+        best_of(lambda: stdlib.render(None, payload, response_status=200), args.number),
+        best_of(lambda: fast.render(None, payload, response_status=200), args.number),
+    )
+
+    body = ORJSONRenderer().render(
+        None, {"article": payload["articles"][0]}, response_status=200
+    )
+    request = RequestFactory().post("/", body, content_type="application/json")
+    stdlib_parser, fast_parser = Parser(), ORJSONParser()
+    report(
+        "parse",
+        best_of(lambda: stdlib_parser.parse_body(request), args.number * 10),
+        best_of(lambda: fast_parser.parse_body(request), args.number * 10),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,6 @@ https://docs.djangoproject.com/en/5.1/ref/settings/
 from pathlib import Path
 from datetime import timedelta
 
-
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -138,6 +137,8 @@ STATIC_ROOT = BASE_DIR / "staticfiles"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 AUTH_USER_MODEL = "accounts.User"
+# Same checks as ModelBackend; async logins hash on the password hashing pool
+AUTHENTICATION_BACKENDS = ["accounts.backends.PooledModelBackend"]
 
 # Password validation
 
@@ -152,8 +153,70 @@ NINJA_JWT = {
     "ALGORITHM": "HS256",
     "AUTH_HEADER_TYPES": ("Token",),
 }
+# In-process cache of authenticated users, per worker
+AUTH_USER_CACHE_SIZE = 10000
+AUTH_USER_CACHE_TIMEOUT = 60
+# In-process cache of verified access tokens, per worker
+AUTH_TOKEN_CACHE_SIZE = 10000
+# Build request.user from the token's user id claim without any lookup. Only
+# for endpoints that need nothing but the id: other fields are each loaded
+# with a query, and deactivated users keep access until their tokens expire
+AUTH_TRUST_TOKEN_CLAIMS = False
+# Password hashing runs on a thread pool of N workers with up to M queued
+# requests; further logins and registrations get a 503 with Retry-After.
+# Only under ASGI (core/asgi.py) does this free the worker while hashing;
+# under WSGI (core/wsgi.py) each request still holds its worker thread, and
+# the pool just caps concurrent hashing and sheds the excess
+PASSWORD_HASHING_WORKERS = 4
+PASSWORD_HASHING_QUEUE_DEPTH = 32
+PASSWORD_HASHING_RETRY_AFTER = 1
+# Login attempts allowed per client IP and per account: (burst, seconds for
+# an empty bucket to refill). Buckets live in each worker unless the backend
+# is "helpers.throttling.CacheBackend", which uses LOGIN_THROTTLE_CACHE.
+LOGIN_THROTTLE_RATES = {"ip": (30, 60), "email": (5, 300)}
+LOGIN_THROTTLE_BACKEND = "helpers.throttling.LocalBackend"
+LOGIN_THROTTLE_CACHE = "default"
+# Cache of each user's followee ids. Follow changes move a per-user version
+# key on commit; workers only see each other's changes if the CACHES backend
+# is shared (e.g. Redis), else they may lag by up to the timeout
+FOLLOW_GRAPH_CACHE = "default"
+FOLLOW_GRAPH_CACHE_TIMEOUT = 300
 # Default user image
 DEFAULT_USER_IMAGE = "https://api.realworld.io/images/smiley-cyrus.jpeg"
+# Article list pagination
+ARTICLES_PAGE_SIZE = 20
+ARTICLES_MAX_PAGE_SIZE = 100
+# Rows loaded and serialized at a time by ?stream=true list responses
+ARTICLES_STREAM_CHUNK_SIZE = 500
+# Totals above the threshold are cached instead of counted on every page
+LARGE_COUNT_THRESHOLD = 10000
+LARGE_COUNT_CACHE_TIMEOUT = 60
+# Number of entries kept in each user's feed timeline
+TIMELINE_MAX_LENGTH = 1000
+# Timelines grown by new articles are trimmed in batches every N seconds,
+# M users per query, from a daemon thread in each worker
+TIMELINE_TRIM_INTERVAL = 60
+TIMELINE_TRIM_CHUNK = 500
+TIMELINE_TRIM_IN_BACKGROUND = True
+# Seconds a viewer-independent article rendering stays cached. Writes clear
+# entries in the cache they run against; with the default per-process
+# cache, other workers keep serving theirs until this expires, so deployments
+# with several workers need a shared CACHES backend (e.g. Redis)
+ARTICLE_CACHE_TIMEOUT = 300
+# Article views are buffered in each worker and written every N seconds or M views
+ARTICLE_VIEWS_FLUSH_INTERVAL = 10
+ARTICLE_VIEWS_FLUSH_EVENTS = 1000
+# Also flush every interval from a daemon thread, so idle workers write their views
+ARTICLE_VIEWS_FLUSH_IN_BACKGROUND = True
+# Popular tags snapshot served by /tags
+POPULAR_TAGS_MAX = 100
+POPULAR_TAGS_CACHE_TIMEOUT = 60
+# NDJSON article import: rows per bulk write, per-line errors kept in the report
+ARTICLES_IMPORT_BATCH_SIZE = 500
+ARTICLES_IMPORT_MAX_ERRORS = 1000
+# In-memory Bloom filters screening unique columns before INSERT
+UNIQUE_PROBE_MIN_CAPACITY = 10000
+UNIQUE_PROBE_ERROR_RATE = 0.01
 
 
 def monkeypatch_ninja_uuid_converter() -> None:
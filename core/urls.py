@@ -21,9 +21,11 @@ from django.conf import settings
 from django.conf.urls.static import static
 from ninja import NinjaAPI
 
+from helpers.renderers import ORJSONParser, ORJSONRenderer
+
 api_prefix = "api"
 
-api = NinjaAPI()
+api = NinjaAPI(renderer=ORJSONRenderer(), parser=ORJSONParser())
 api.add_router(f"/{api_prefix}", "accounts.api.router")
 api.add_router(f"/{api_prefix}", "articles.api.router")
 api.add_router("/images", "image_server.api.router")
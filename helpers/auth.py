@@ -1,10 +1,31 @@
+import time
+from hashlib import sha256
 from typing import Any, Optional
 
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from django.http import HttpRequest
 from ninja.security import HttpBearer
 from ninja_jwt.authentication import JWTBaseAuthentication
+from ninja_jwt.exceptions import InvalidToken, TokenError
+from ninja_jwt.settings import api_settings
+from ninja_jwt.tokens import Token
 
 from accounts.models import User
+from helpers.lru import LRUCache
+
+# Columns cached per user id; the password hash is left out and loaded on
+# demand like any deferred field.
+CACHED_USER_FIELDS = [
+    field.attname for field in User._meta.concrete_fields if field.name != "password"
+]
+
+users = LRUCache(settings.AUTH_USER_CACHE_SIZE, settings.AUTH_USER_CACHE_TIMEOUT)
+# Verified tokens by SHA-256 of the raw token, each kept until its "exp".
+tokens = LRUCache(settings.AUTH_TOKEN_CACHE_SIZE)
 
 
 class AuthJWT(HttpBearer, JWTBaseAuthentication):
@@ -16,7 +37,71 @@ class AuthJWT(HttpBearer, JWTBaseAuthentication):
         super().__init__(*args, **kwargs)
 
     def __call__(self, request: HttpRequest) -> Optional[Any]:
-        return super().__call__(request)
+        user = super().__call__(request)
+        if user is None and self.pass_even:
+            request.user = AnonymousUser()
+            return request.user
+        return user
 
     def authenticate(self, request: HttpRequest, key) -> Optional[Any]:
         return self.jwt_authenticate(request, token=key)
+
+    @classmethod
+    def get_validated_token(cls, raw_token) -> Token:
+        """The verified token, skipping the signature check on a cache hit.
+
+        Blacklist checks, where the token class has them, still run on hits.
+        """
+        key = sha256(str(raw_token).encode()).digest()
+        token = tokens.get(key)
+        if token is None:
+            token = super().get_validated_token(raw_token)
+            tokens.set(key, token, ttl=token["exp"] - time.time())
+            return token
+        if hasattr(token, "check_blacklist"):
+            try:
+                token.check_blacklist()
+            except TokenError as error:
+                tokens.pop(key)
+                raise InvalidToken(error.args[0]) from error
+        return token
+
+    def get_user(self, validated_token) -> User:
+        """The token's user, from the in-process cache when possible.
+
+        With `AUTH_TRUST_TOKEN_CLAIMS` the database is not consulted at all:
+        the user only carries its id, and each other field read costs its own
+        query. `is_active` is not checked either, so a deactivated user keeps
+        access until their tokens expire.
+        Every request gets its own instance, so handlers may modify it.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as error:
+            raise InvalidToken(
+                "Token contained no recognizable user identification"
+            ) from error
+        if settings.AUTH_TRUST_TOKEN_CLAIMS:
+            return User.from_db(
+                DEFAULT_DB_ALIAS, ["id"], [User._meta.pk.to_python(user_id)]
+            )
+        values = users.get(str(user_id))
+        if values is None:
+            user = super().get_user(validated_token)
+            users.set(
+                str(user_id), tuple(getattr(user, name) for name in CACHED_USER_FIELDS)
+            )
+            return user
+        return User.from_db(DEFAULT_DB_ALIAS, CACHED_USER_FIELDS, values)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # Covers profile updates, password changes and deactivation; other
+    # workers catch up within AUTH_USER_CACHE_TIMEOUT.
+    users.pop(str(instance.pk))
+
+
+def cache_stats() -> dict[str, dict[str, int]]:
+    return {"users": users.stats(), "tokens": tokens.stats()}
@@ -1,15 +1,57 @@
+from functools import cache
 from sqlite3 import IntegrityError
 
+from django.apps import apps
+from django.db import connection
 from psycopg2.errors import UniqueViolation
 
 
-def clean_integrity_error(error):
+@cache
+def _field_names() -> dict[tuple[str, str], str]:
+    """`(table, column)` -> model field name, for every installed model."""
+    return {
+        (model._meta.db_table, field.column): field.name
+        for model in apps.get_models()
+        for field in model._meta.local_fields
+    }
 
-    try:
-        if isinstance(error.__cause__, UniqueViolation):
-            return error.__cause__.args[0].split(":")[1].split("(")[1].split(")")[0]
-        if isinstance(error.__cause__, IntegrityError):
-            return error.__cause__.args[0].split(": ")[1].split(".")[1]
-        return None
-    except Exception:
+
+@cache
+def _unique_constraints() -> dict[str, tuple[str, list[str]]]:
+    """Unique constraint name -> `(table, columns)`, as introspected."""
+    introspection = connection.introspection
+    with connection.cursor() as cursor:
+        return {
+            name: (table, info["columns"])
+            for table in introspection.table_names(cursor)
+            for name, info in introspection.get_constraints(cursor, table).items()
+            if info["unique"]
+        }
+
+
+def _violated_columns(cause) -> tuple[str, list[str]] | None:
+    if isinstance(cause, UniqueViolation):
+        name = cause.diag.constraint_name
+        if name not in _unique_constraints():
+            _unique_constraints.cache_clear()
+        return _unique_constraints().get(name)
+    if (
+        isinstance(cause, IntegrityError)
+        and getattr(cause, "sqlite_errorname", None) == "SQLITE_CONSTRAINT_UNIQUE"
+    ):
+        # SQLite names the columns, not the constraint:
+        # "UNIQUE constraint failed: table.column[, table.column]".
+        pairs = [
+            column.split(".", 1) for column in str(cause).split(": ", 1)[1].split(", ")
+        ]
+        return pairs[0][0], [column for _, column in pairs]
+    return None
+
+
+def clean_integrity_error(error) -> str | None:
+    """Name of the field(s) whose unique constraint `error` violated."""
+    violated = _violated_columns(error.__cause__)
+    if violated is None:
         return None
+    table, columns = violated
+    return ", ".join(_field_names().get((table, column), column) for column in columns)
@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PoolSaturated(Exception):
+    """Every worker is busy and the queue is full; the caller should back off."""
+
+
+class HashingPool:
+    """Runs password hashing off the request worker, with bounded queueing.
+
+    At most `workers` hashes run at once and `queue_depth` more may wait;
+    anything beyond that is refused immediately with `PoolSaturated` instead
+    of piling up. PBKDF2 releases the GIL, so threads hash in parallel.
+
+    The request worker is only freed while hashing when served over ASGI
+    (`core/asgi.py`). Under WSGI (`core/wsgi.py`) Django runs each async
+    view in its own event loop on the request thread, which stays blocked
+    until the hash is done; the pool then only bounds concurrent hashing.
+    """
+
+    def __init__(self, workers: int, queue_depth: int):
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="password-hashing"
+        )
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+
+    async def run(self, fn: Callable, *args) -> Any:
+        if not self._slots.acquire(blocking=False):
+            raise PoolSaturated
+        try:
+            future = self._executor.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return await asyncio.wrap_future(future)
+
+
+pool = HashingPool(
+    settings.PASSWORD_HASHING_WORKERS, settings.PASSWORD_HASHING_QUEUE_DEPTH
+)
+
+
+async def make_password(password: str) -> str:
+    return await pool.run(hashers.make_password, password)
+
+
+async def verify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """`(is_correct, must_update)`, as `django.contrib.auth.hashers` computes them.
+
+    An empty `encoded` still costs a full hash, so unknown accounts answer
+    as slowly as known ones.
+    """
+    return await pool.run(hashers.verify_password, password, encoded)
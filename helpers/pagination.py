@@ -0,0 +1,89 @@
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from hashlib import sha1
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+
+class InvalidCursor(ValueError): ...
+
+
+def encode_cursor(key: datetime | float, pk: int) -> str:
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    raw = json.dumps([key, pk], separators=(",", ":"))
+    return urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str, parse: Callable[[Any], Any] = datetime.fromisoformat
+) -> tuple[Any, int]:
+    try:
+        raw = urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key, pk = json.loads(raw)
+        return parse(key), int(pk)
+    except (ValueError, TypeError) as error:
+        raise InvalidCursor(cursor) from error
+
+
+def after_cursor(
+    queryset: models.QuerySet,
+    cursor: str | None,
+    keys: tuple[str, str] = ("created_at", "id"),
+) -> models.QuerySet:
+    """`queryset`, newest first, starting after `cursor`."""
+    ts_key, pk_key = keys
+    queryset = queryset.order_by(f"-{ts_key}", f"-{pk_key}")
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        queryset = queryset.filter(
+            models.Q(**{f"{ts_key}__lt": created_at})
+            | models.Q(**{ts_key: created_at, f"{pk_key}__lt": pk})
+        )
+    return queryset
+
+
+def paginate(
+    queryset: models.QuerySet,
+    cursor: str | None,
+    limit: int,
+    keys: tuple[str, str] = ("created_at", "id"),
+) -> tuple[list, str | None]:
+    """Keyset pagination, newest first, on a `(timestamp, id)` pair of columns.
+
+    Rows may be model instances or `.values()` dicts. Returns the page and the
+    cursor of the following page (`None` on the last).
+    """
+    ts_key, pk_key = keys
+    page = list(after_cursor(queryset, cursor, keys)[: limit + 1])
+    if len(page) <= limit:
+        return page, None
+    last = page[limit - 1]
+    if isinstance(last, dict):
+        return page[:limit], encode_cursor(last[ts_key], last[pk_key])
+    return page[:limit], encode_cursor(getattr(last, ts_key), getattr(last, pk_key))
+
+
+def count_key(prefix: str, **params: str | None) -> str:
+    """Cache key for `count`; unset parameters are dropped and the rest hashed."""
+    query = urlencode(sorted((k, v) for k, v in params.items() if v not in (None, "")))
+    return f"{prefix}:{sha1(query.encode()).hexdigest()}"
+
+
+def count(queryset: models.QuerySet, cache_key: str) -> int:
+    """Total number of rows, cached for a while once it gets large.
+
+    Small totals are cheap to count exactly on every call; large ones are
+    reused for `LARGE_COUNT_CACHE_TIMEOUT` seconds.
+    """
+    total = cache.get(cache_key)
+    if total is None:
+        total = queryset.order_by().count()
+        if total >= settings.LARGE_COUNT_THRESHOLD:
+            cache.set(cache_key, total, settings.LARGE_COUNT_CACHE_TIMEOUT)
+    return total
@@ -0,0 +1,28 @@
+from typing import Any
+
+import orjson
+from django.http import HttpRequest
+from ninja.parser import Parser
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+# datetime, date, UUID, dataclasses and enums are encoded natively; anything
+# else (pydantic models, lazy strings, Decimal, ...) goes through the same
+# fallback as ninja's stdlib encoder.
+_default = NinjaJSONEncoder().default
+
+
+def dumps(data: Any) -> bytes:
+    return orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z)
+
+
+class ORJSONRenderer(BaseRenderer):
+    media_type = "application/json"
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        return dumps(data)
+
+
+class ORJSONParser(Parser):
+    def parse_body(self, request: HttpRequest) -> dict[str, Any]:
+        return orjson.loads(request.body)
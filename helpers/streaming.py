@@ -0,0 +1,47 @@
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Iterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpRequest, StreamingHttpResponse
+
+from helpers.renderers import dumps
+
+
+def chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def stream_json(
+    request: HttpRequest, head: dict, key: str, chunks: Iterable[list[Any]]
+) -> StreamingHttpResponse:
+    """Stream `{**head, key: [...]}`, encoding the list one chunk at a time.
+
+    Only the chunk being encoded is held in memory, however long the list.
+    Under ASGI the body is an async iterator that loads each chunk through
+    `sync_to_async`; Django would otherwise collect a sync one into a list
+    before sending anything.
+    """
+    parts = _encode(head, key, chunks)
+    if isinstance(request, ASGIRequest):
+        parts = _each_off_thread(parts)
+    return StreamingHttpResponse(parts, content_type="application/json")
+
+
+async def _each_off_thread(parts: Iterator[bytes]) -> AsyncIterator[bytes]:
+    step = sync_to_async(next)
+    while (part := await step(parts, None)) is not None:
+        yield part
+
+
+def _encode(head: dict, key: str, chunks: Iterable[list[Any]]) -> Iterator[bytes]:
+    envelope = dumps({**head, key: []})
+    yield envelope[: -len(b"]}")]
+    separator = b""
+    for chunk in chunks:
+        if chunk:
+            yield separator + dumps(chunk)[1:-1]
+            separator = b","
+    yield b"]}"
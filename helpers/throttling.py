@@ -0,0 +1,138 @@
+import math
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from hashlib import sha256
+from typing import Sequence
+
+from django.conf import settings
+from django.core.cache import caches
+from django.http import HttpRequest
+from django.utils.module_loading import import_string
+from ninja.throttling import BaseThrottle
+
+from helpers.lru import LRUCache
+
+# (key, capacity, period)
+Bucket = tuple[str, int, float]
+
+
+class TokenBucketBackend(ABC):
+    """Token buckets holding up to `capacity` tokens, refilled over `period` seconds.
+
+    Subclasses store each bucket's `(tokens, updated_at)` state. A bucket left
+    alone for `period` seconds is full again, so states only need to be kept
+    that long.
+    """
+
+    def _clock(self) -> float:
+        return time.time()
+
+    @abstractmethod
+    def _load(self, key: str) -> tuple[float, float] | None: ...
+
+    @abstractmethod
+    def _store(self, key: str, state: tuple[float, float], period: float) -> None: ...
+
+    def take(self, key: str, capacity: int, period: float) -> float:
+        """Take a token from `key`'s bucket.
+
+        Returns 0 if there was one, else the seconds until one is available.
+        """
+        return self.take_all([(key, capacity, period)])[0]
+
+    def take_all(self, buckets: Sequence[Bucket]) -> list[float]:
+        """Take a token from every `(key, capacity, period)` bucket, or from none.
+
+        Returns each bucket's wait for a token; tokens are only taken when
+        every wait is 0, so a refusal by one bucket costs the others nothing.
+        """
+        now = self._clock()
+        levels, waits = [], []
+        for key, capacity, period in buckets:
+            tokens, updated_at = self._load(key) or (capacity, now)
+            rate = capacity / period
+            tokens = min(capacity, tokens + (now - updated_at) * rate)
+            levels.append(tokens)
+            waits.append(0.0 if tokens >= 1 else (1 - tokens) / rate)
+        if not any(waits):
+            for (key, _, period), tokens in zip(buckets, levels):
+                self._store(key, (tokens - 1, now), period)
+        return waits
+
+
+class LocalBackend(TokenBucketBackend):
+    """Buckets in this process's memory; every worker throttles on its own."""
+
+    def __init__(self, maxsize: int = 100_000):
+        self._buckets = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def _clock(self) -> float:
+        return time.monotonic()
+
+    def _load(self, key: str) -> tuple[float, float] | None:
+        return self._buckets.get(key)
+
+    def _store(self, key: str, state: tuple[float, float], period: float) -> None:
+        self._buckets.set(key, state, ttl=period)
+
+    def take_all(self, buckets: Sequence[Bucket]) -> list[float]:
+        with self._lock:
+            return super().take_all(buckets)
+
+
+class CacheBackend(TokenBucketBackend):
+    """Buckets in the `LOGIN_THROTTLE_CACHE` cache, shared by every worker.
+
+    Reads and writes are not atomic, so concurrent attempts on one bucket can
+    occasionally both get the last token.
+    """
+
+    def __init__(self):
+        self._cache = caches[settings.LOGIN_THROTTLE_CACHE]
+
+    def _load(self, key: str) -> tuple[float, float] | None:
+        return self._cache.get(key)
+
+    def _store(self, key: str, state: tuple[float, float], period: float) -> None:
+        self._cache.set(key, state, timeout=math.ceil(period))
+
+
+backend: TokenBucketBackend = import_string(settings.LOGIN_THROTTLE_BACKEND)()
+
+# "<scope>.allowed" and "<scope>.throttled" decisions, for monitoring.
+metrics: Counter[str] = Counter()
+
+
+def _client_ip(request: HttpRequest) -> str:
+    # Honours NINJA_NUM_PROXIES like django-ninja's own throttles.
+    return BaseThrottle().get_ident(request) or ""
+
+
+def check_login(request: HttpRequest, email: str) -> float:
+    """Spend a login attempt from the client's IP and the account's buckets.
+
+    Returns 0 if the attempt may proceed, else the seconds to wait. Refused
+    attempts are stopped before any password is hashed, and spend nothing
+    from either bucket.
+    """
+    scopes = (("ip", _client_ip(request)), ("email", email.lower()))
+    buckets = []
+    for scope, value in scopes:
+        capacity, period = settings.LOGIN_THROTTLE_RATES[scope]
+        key = f"login-throttle:{scope}:{sha256(value.encode()).hexdigest()}"
+        buckets.append((key, capacity, period))
+    waits = backend.take_all(buckets)
+    refused = any(waits)
+    for (scope, _), wait in zip(scopes, waits):
+        if wait:
+            metrics[f"{scope}.throttled"] += 1
+        elif not refused:
+            metrics[f"{scope}.allowed"] += 1
+    return max(waits)
+
+
+def stats() -> dict[str, int]:
+    return dict(metrics)
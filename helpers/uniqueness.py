@@ -0,0 +1,131 @@
+import math
+import threading
+from hashlib import blake2b
+
+from django.conf import settings
+from django.db import models
+from django.db.models.signals import post_save
+
+
+class BloomFilter:
+    """Fixed-size set membership test with no false negatives.
+
+    `value in bloom` is `False` only for values that were never added; a `True`
+    may be a false positive, at a rate close to `error_rate` while no more than
+    `capacity` values have been added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+        # `|=` on a byte is a read-modify-write; concurrent adds touching the
+        # same byte could otherwise drop each other's bits.
+        self._lock = threading.Lock()
+
+    def _positions(self, value: str):
+        digest = blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hashes))
+
+    def add(self, value: str) -> None:
+        positions = list(self._positions(value))
+        with self._lock:
+            for position in positions:
+                self.bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, value: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(value)
+        )
+
+
+class UniqueProbe:
+    """In-process screen for the values already taken in a unique column.
+
+    The filter is built from the table on first use, kept up to date from
+    `post_save` and rebuilt once it outgrows its capacity. Writes made by other
+    processes or by `bulk_create`/`update()` are not seen, so a miss is only a
+    hint: the database constraint stays the authority.
+    """
+
+    def __init__(self, model: type[models.Model], field: str):
+        self.model = model
+        self.field = field
+        self._bloom: BloomFilter | None = None
+        self._lock = threading.Lock()
+        post_save.connect(self._on_save, sender=model, weak=False)
+
+    def _build(self) -> BloomFilter:
+        values = self.model._base_manager.values_list(self.field, flat=True)
+        bloom = BloomFilter(
+            max(settings.UNIQUE_PROBE_MIN_CAPACITY, 2 * values.count()),
+            settings.UNIQUE_PROBE_ERROR_RATE,
+        )
+        for value in values.iterator():
+            bloom.add(value)
+        return bloom
+
+    def _filter(self) -> BloomFilter:
+        bloom = self._bloom
+        if bloom is None or bloom.count > bloom.capacity:
+            with self._lock:
+                bloom = self._bloom
+                if bloom is None or bloom.count > bloom.capacity:
+                    bloom = self._bloom = self._build()
+        return bloom
+
+    def might_exist(self, value: str) -> bool:
+        return value in self._filter()
+
+    def add(self, *values: str) -> None:
+        if self._bloom is not None:
+            for value in values:
+                self._bloom.add(value)
+
+    def reset(self) -> None:
+        self._bloom = None
+
+    def _on_save(self, sender, instance, **kwargs):
+        self.add(getattr(instance, self.field))
+
+
+_probes: dict[tuple[type[models.Model], str], UniqueProbe] = {}
+_probes_lock = threading.Lock()
+
+
+def probe(model: type[models.Model], field: str) -> UniqueProbe:
+    key = (model, field)
+    if key not in _probes:
+        with _probes_lock:
+            if key not in _probes:
+                _probes[key] = UniqueProbe(model, field)
+    return _probes[key]
+
+
+def taken(model: type[models.Model], **values: str) -> str | None:
+    """Name of the first field whose value is already taken, else `None`.
+
+    Values the probe has never seen skip the database; likely duplicates are
+    confirmed with an `exists()` query against the default manager, so
+    values only held by rows it hides, such as soft-deleted articles, are free.
+    """
+    for field, value in values.items():
+        if (
+            probe(model, field).might_exist(value)
+            and model._default_manager.filter(**{field: value}).exists()
+        ):
+            return field
+    return None
+
+
+def reset() -> None:
+    for unique_probe in _probes.values():
+        unique_probe.reset()
@@ -0,0 +1,67 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+
+class WriteBehind:
+    """Base for in-memory buffers written to the database in batches.
+
+    Subclasses implement `flush()`, which writes and empties the buffer and
+    restores it if the write fails. With `background=True`, and the
+    `background_setting` setting on, a daemon thread also flushes every
+    `interval_setting` seconds, so an idle worker's buffer is written too.
+    """
+
+    interval_setting: str
+    background_setting: str
+    description: str
+
+    def __init__(self, background: bool = False):
+        self._lock = threading.Lock()
+        self._background = background
+        self._thread: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    def flush(self) -> int:
+        raise NotImplementedError
+
+    def flush_quietly(self) -> int:
+        try:
+            return self.flush()
+        except DatabaseError:
+            logger.exception(
+                "Writing %s failed; retrying on next flush", self.description
+            )
+            return 0
+
+    def stop(self) -> None:
+        """Stop the background thread; the buffer is kept."""
+        self._stopped.set()
+
+    def _interval(self) -> float:
+        return getattr(settings, self.interval_setting)
+
+    def _in_background(self) -> bool:
+        return self._background and getattr(settings, self.background_setting)
+
+    def _start_background(self) -> None:
+        if self._thread is not None or not self._in_background():
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._flush_periodically,
+                    name=f"{self.description.replace(' ', '-')}-flush",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _flush_periodically(self) -> None:
+        while not self._stopped.wait(self._interval() or 1):
+            self.flush_quietly()
+            # Only this thread's connections; don't hold one between flushes.
+            connections.close_all()
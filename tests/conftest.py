@@ -9,6 +9,11 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 def pytest_configure():
     # settings.configure(DATABASES=...)
     settings.DATABASES["default"]["NAME"] = BASE_DIR / "test_db.sqlite3"
+    # Tests flush view counts and timeline trims explicitly; a background
+    # thread would write through its own connection, outside the test's
+    # transaction.
+    settings.ARTICLE_VIEWS_FLUSH_IN_BACKGROUND = False
+    settings.TIMELINE_TRIM_IN_BACKGROUND = False
 
 
 @pytest.fixture(scope="module")
@@ -0,0 +1,19 @@
+from collections import Counter
+
+import pytest
+
+from accounts import follows
+from helpers import throttling
+
+
+@pytest.fixture(autouse=True)
+def login_throttle(monkeypatch):
+    backend = throttling.LocalBackend()
+    monkeypatch.setattr(throttling, "backend", backend)
+    monkeypatch.setattr(throttling, "metrics", Counter())
+    return backend
+
+
+@pytest.fixture(autouse=True)
+def clear_follows():
+    follows.clear()
@@ -0,0 +1,116 @@
+from uuid import uuid4
+
+import pytest
+from django.conf import settings
+from django.core.cache import caches
+from django.db import DatabaseError, connection, transaction
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from ninja_jwt.tokens import AccessToken
+
+from accounts import follows
+from accounts.follows import FolloweeSet, followees
+from accounts.models import User
+from accounts.schemas import ProfileSchema
+
+
+@pytest.fixture
+def reader(django_db):
+    return User.objects.create_user("reader@example.com", username="reader")
+
+
+@pytest.fixture
+def writer(django_db):
+    return User.objects.create_user("writer@example.com", username="writer")
+
+
+def _follow(method, user, username):
+    return getattr(Client(), method)(
+        f"/api/profiles/{username}/follow",
+        HTTP_AUTHORIZATION=f"Token {AccessToken.for_user(user)}",
+    )
+
+
+def test_followee_set_membership():
+    ids = [uuid4() for _ in range(50)]
+    followed = FolloweeSet(ids[:25])
+    assert len(followed) == 25
+    assert all(pk in followed for pk in ids[:25])
+    assert not any(pk in followed for pk in ids[25:])
+    assert str(ids[0]) in followed
+    assert sorted(followed) == sorted(ids[:25])
+    assert FolloweeSet.from_packed(followed.packed) is not followed
+    assert list(FolloweeSet.from_packed(followed.packed)) == list(followed)
+
+
+@pytest.mark.django_db
+def test_followees_are_loaded_once_and_kept_current(
+    reader, writer, django_capture_on_commit_callbacks
+):
+    assert writer.id not in followees(reader)
+    with CaptureQueriesContext(connection) as queries:
+        assert not reader.is_following(writer)
+    assert len(queries) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert _follow("post", reader, "writer").status_code == 200
+    assert reader.is_following(writer)
+    with CaptureQueriesContext(connection) as queries:
+        assert reader.is_following(writer)
+    assert len(queries) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert _follow("delete", reader, "writer").status_code == 200
+    assert writer.id not in followees(reader)
+    with django_capture_on_commit_callbacks(execute=True):
+        reader.following.add(writer)
+    assert writer.id in followees(reader)
+    with django_capture_on_commit_callbacks(execute=True):
+        reader.following.clear()
+    assert writer.id not in followees(reader)
+    with django_capture_on_commit_callbacks(execute=True):
+        reader.following.add(writer)
+    assert writer.id in followees(reader)
+    # A reverse clear looks up whose followees it changes.
+    with django_capture_on_commit_callbacks(execute=True):
+        writer.followers.clear()
+    assert writer.id not in followees(reader)
+
+
+@pytest.mark.django_db
+def test_followees_change_only_on_commit(reader, writer):
+    followees(reader)
+    try:
+        with transaction.atomic():
+            reader.following.add(writer)
+            raise DatabaseError
+    except DatabaseError:
+        pass
+    assert writer.id not in followees(reader)
+
+
+@pytest.mark.django_db
+def test_followees_are_shared_through_the_cache(reader, writer):
+    followees(reader)
+    # What another worker would find in the shared cache.
+    cache = caches[settings.FOLLOW_GRAPH_CACHE]
+    version = cache.get(f"follows:{reader.pk}:version")
+    assert cache.get(f"follows:{reader.pk}:{version}") == b""
+    follows.invalidate(reader.pk)
+    assert cache.get(f"follows:{reader.pk}:version") is None
+
+
+@pytest.mark.django_db
+def test_profile_following_flag_is_a_membership_test(
+    reader, writer, rf, django_capture_on_commit_callbacks
+):
+    # A reverse add changes the follower's followees.
+    with django_capture_on_commit_callbacks(execute=True):
+        writer.followers.add(reader)
+    followees(reader)
+    request = rf.get("/")
+    request.user = reader
+    with CaptureQueriesContext(connection) as queries:
+        profile = ProfileSchema.from_orm(writer, context={"request": request})
+    assert len(queries) == 0
+    assert profile.following
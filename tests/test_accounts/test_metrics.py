@@ -0,0 +1,50 @@
+import pytest
+from django.test import Client
+from ninja_jwt.tokens import AccessToken
+
+from accounts.models import User
+
+
+def _metrics(user, token=None):
+    token = token or AccessToken.for_user(user)
+    return Client().get("/api/metrics", HTTP_AUTHORIZATION=f"Token {token}")
+
+
+@pytest.mark.django_db
+def test_metrics_are_staff_only(django_db):
+    user = User.objects.create_user("user@example.com", username="user")
+    assert _metrics(user).status_code == 403
+    assert Client().get("/api/metrics").status_code == 401
+
+
+@pytest.mark.django_db
+def test_metrics_report_auth_cache(django_db):
+    staff = User.objects.create_user(
+        "staff@example.com", username="staff", is_staff=True
+    )
+    token = AccessToken.for_user(staff)
+    before = _metrics(staff, token).json()["authCache"]
+    after = _metrics(staff, token).json()["authCache"]
+    # The second request found the first one's token and user cached.
+    assert after["tokens"]["hits"] - before["tokens"]["hits"] == 1
+    assert after["users"]["hits"] - before["users"]["hits"] == 1
+    assert after["users"]["size"] >= 1
+
+
+@pytest.mark.django_db
+def test_metrics_report_login_throttle(django_db, settings):
+    settings.LOGIN_THROTTLE_RATES = {"ip": (100, 60), "email": (1, 60)}
+    staff = User.objects.create_user(
+        "staff@example.com", username="staff", is_staff=True
+    )
+    for _ in range(2):
+        Client().post(
+            "/api/usres/login",
+            data={"user": {"email": "staff@example.com", "password": "wrong"}},
+            content_type="application/json",
+        )
+    assert _metrics(staff).json()["loginThrottle"] == {
+        "ip.allowed": 1,
+        "email.allowed": 1,
+        "email.throttled": 1,
+    }
@@ -0,0 +1,106 @@
+import asyncio
+import threading
+
+import pytest
+from django.contrib.auth.signals import user_login_failed
+from django.test import Client
+
+from accounts.models import User
+from helpers import hashing
+
+
+def _post(path, user, **headers):
+    return Client().post(
+        path, data={"user": user}, content_type="application/json", **headers
+    )
+
+
+def _login(email, password):
+    return _post("/api/usres/login", {"email": email, "password": password})
+
+
+@pytest.fixture
+def account(django_db):
+    return User.objects.create_user(
+        "login@example.com", username="login", password="secret"
+    )
+
+
+@pytest.mark.django_db
+def test_login_checks_the_password(account):
+    response = _login("login@example.com", "secret")
+    assert response.status_code == 200
+    assert response.json()["user"]["username"] == "login"
+    assert _login("login@example.com", "wrong").status_code == 401
+    assert _login("nobody@example.com", "secret").status_code == 401
+    account.is_active = False
+    account.save()
+    assert _login("login@example.com", "secret").status_code == 401
+
+
+@pytest.mark.django_db
+def test_login_goes_through_the_authentication_backends(account):
+    failures = []
+
+    def record(sender, credentials, **kwargs):
+        failures.append(credentials)
+
+    user_login_failed.connect(record)
+    try:
+        assert _login("login@example.com", "wrong").status_code == 401
+    finally:
+        user_login_failed.disconnect(record)
+    assert [credentials["email"] for credentials in failures] == ["login@example.com"]
+
+
+@pytest.mark.django_db
+def test_registered_and_updated_passwords_log_in(django_db):
+    response = _post(
+        "/api/user",
+        {"email": "new@example.com", "username": "new", "password": "first"},
+    )
+    assert response.status_code == 201
+    response = Client().put(
+        "/api/user",
+        data={"user": {"password": "second", "bio": "hi"}},
+        content_type="application/json",
+        HTTP_AUTHORIZATION=f"Token {response.json()['token']}",
+    )
+    assert response.status_code == 200
+    assert User.objects.get(username="new").bio == "hi"
+    assert _login("new@example.com", "first").status_code == 401
+    assert _login("new@example.com", "second").status_code == 200
+
+
+@pytest.mark.django_db
+def test_saturated_pool_answers_503(account, monkeypatch):
+    pool = hashing.HashingPool(workers=1, queue_depth=0)
+    pool._slots.acquire()
+    monkeypatch.setattr(hashing, "pool", pool)
+    response = _login("login@example.com", "secret")
+    assert response.status_code == 503
+    assert response["Retry-After"] == "1"
+    response = _post(
+        "/api/user",
+        {"email": "new@example.com", "username": "new", "password": "secret"},
+    )
+    assert response.status_code == 503
+    assert not User.objects.filter(username="new").exists()
+
+
+def test_pool_refuses_work_beyond_its_queue():
+    pool = hashing.HashingPool(workers=1, queue_depth=1)
+    release = threading.Event()
+
+    async def scenario():
+        running = asyncio.ensure_future(pool.run(release.wait))
+        queued = asyncio.ensure_future(pool.run(lambda: "queued"))
+        await asyncio.sleep(0)
+        with pytest.raises(hashing.PoolSaturated):
+            await pool.run(lambda: "refused")
+        release.set()
+        assert await running is True
+        assert await queued == "queued"
+        return await pool.run(lambda: "accepted")
+
+    assert asyncio.run(scenario()) == "accepted"
@@ -0,0 +1,44 @@
+import pytest
+from django.db import connection
+from django.test import Client
+
+from accounts.models import User
+from helpers import exceptions, uniqueness
+
+
+def _register(email, username):
+    return Client().post(
+        "/api/user",
+        data={"user": {"email": email, "username": username, "password": "secret"}},
+        content_type="application/json",
+    )
+
+
+@pytest.mark.django_db
+def test_registration_rejects_taken_email_and_username(django_db):
+    assert _register("new@example.com", "new").status_code == 201
+    response = _register("new@example.com", "other")
+    assert response.status_code == 409
+    assert response.json() == {"already_existing": "email"}
+    response = _register("other@example.com", "new")
+    assert response.status_code == 409
+    assert response.json() == {"already_existing": "username"}
+    assert User.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_registration_race_answers_409(django_db, monkeypatch):
+    assert _register("new@example.com", "new").status_code == 201
+    # As if the other registration committed after the pre-check.
+    monkeypatch.setattr(uniqueness, "taken", lambda model, **values: None)
+    _field_names = exceptions._field_names
+
+    def sync_only():
+        # Stands in for the catalog query run on PostgreSQL.
+        connection.ensure_connection()
+        return _field_names()
+
+    monkeypatch.setattr(exceptions, "_field_names", sync_only)
+    response = _register("new@example.com", "other")
+    assert response.status_code == 409
+    assert response.json() == {"already_existing": "email"}
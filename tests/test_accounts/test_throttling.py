@@ -0,0 +1,104 @@
+import pytest
+from django.test import Client
+
+from accounts.models import User
+from helpers import hashing, throttling
+
+
+def _login(email, ip="10.0.0.1"):
+    return Client(REMOTE_ADDR=ip).post(
+        "/api/usres/login",
+        data={"user": {"email": email, "password": "wrong"}},
+        content_type="application/json",
+    )
+
+
+@pytest.fixture
+def account(django_db):
+    return User.objects.create_user(
+        "login@example.com", username="login", password="secret"
+    )
+
+
+@pytest.mark.django_db
+def test_login_is_throttled_per_account(account, settings, monkeypatch):
+    settings.LOGIN_THROTTLE_RATES = {"ip": (100, 60), "email": (2, 60)}
+    hashed = []
+    verify_password = hashing.verify_password
+
+    async def counting(*args):
+        hashed.append(args)
+        return await verify_password(*args)
+
+    monkeypatch.setattr(hashing, "verify_password", counting)
+    before = throttling.stats()
+    assert _login("login@example.com", ip="10.0.0.1").status_code == 401
+    assert _login("LOGIN@example.com", ip="10.0.0.2").status_code == 401
+    response = _login("login@example.com", ip="10.0.0.3")
+    assert response.status_code == 429
+    assert 0 < int(response["Retry-After"]) <= 30
+    assert len(hashed) == 2
+    assert _login("other@example.com").status_code == 401
+    after = throttling.stats()
+    assert after["email.throttled"] - before.get("email.throttled", 0) == 1
+    assert after["email.allowed"] - before.get("email.allowed", 0) == 3
+
+
+@pytest.mark.django_db
+def test_login_is_throttled_per_ip(account, settings):
+    settings.LOGIN_THROTTLE_RATES = {"ip": (2, 60), "email": (100, 60)}
+    assert _login("a@example.com").status_code == 401
+    assert _login("b@example.com").status_code == 401
+    assert _login("c@example.com").status_code == 429
+    assert _login("c@example.com", ip="10.0.0.2").status_code == 401
+
+
+@pytest.mark.django_db
+def test_refused_account_does_not_spend_ip_attempts(account, settings):
+    settings.LOGIN_THROTTLE_RATES = {"ip": (3, 60), "email": (1, 60)}
+    assert _login("login@example.com").status_code == 401
+    for _ in range(5):
+        assert _login("login@example.com").status_code == 429
+    assert _login("a@example.com").status_code == 401
+    assert _login("b@example.com").status_code == 401
+    assert _login("c@example.com").status_code == 429
+
+
+class FakeClock(throttling.LocalBackend):
+    now = 0.0
+
+    def _clock(self):
+        return self.now
+
+
+def test_bucket_refills_over_its_period():
+    backend = FakeClock()
+    assert [backend.take("key", 2, 10) for _ in range(3)] == [0, 0, 5]
+    backend.now = 4
+    assert backend.take("key", 2, 10) == pytest.approx(1)
+    backend.now = 5
+    assert backend.take("key", 2, 10) == 0
+    backend.now = 100
+    assert [backend.take("key", 2, 10) for _ in range(3)] == [0, 0, 5]
+
+
+def test_buckets_are_taken_together_or_not_at_all():
+    backend = FakeClock()
+    assert backend.take_all([("a", 2, 10), ("b", 1, 10)]) == [0, 0]
+    assert backend.take_all([("a", 2, 10), ("b", 1, 10)]) == [0, 10]
+    assert backend.take("a", 2, 10) == 0
+    assert backend.take("a", 2, 10) == 5
+
+
+def test_backends_must_store_buckets():
+    with pytest.raises(TypeError):
+        throttling.TokenBucketBackend()
+
+
+def test_cache_backend_shares_buckets(settings):
+    settings.LOGIN_THROTTLE_CACHE = "default"
+    first, second = throttling.CacheBackend(), throttling.CacheBackend()
+    key = "login-throttle:test:shared"
+    first._cache.delete(key)
+    assert first.take(key, 1, 60) == 0
+    assert second.take(key, 1, 60) > 0
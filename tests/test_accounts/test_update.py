@@ -0,0 +1,30 @@
+import pytest
+from django.test import Client
+from ninja_jwt.tokens import AccessToken
+
+from accounts.models import User
+from helpers import auth
+
+
+def _put(user, **fields):
+    return Client().put(
+        "/api/user",
+        data={"user": fields},
+        content_type="application/json",
+        HTTP_AUTHORIZATION=f"Token {AccessToken.for_user(user)}",
+    )
+
+
+@pytest.mark.django_db
+def test_update_does_not_revert_changes_made_elsewhere(django_db):
+    auth.users.clear()
+    user = User.objects.create_user("update@example.com", username="before")
+    headers = {"HTTP_AUTHORIZATION": f"Token {AccessToken.for_user(user)}"}
+    assert Client().get("/api/articles/feed", **headers).status_code == 200
+    # Another worker renames the user; this worker's cached copy is stale.
+    User.objects.filter(pk=user.pk).update(username="after")
+    response = _put(user, bio="second")
+    assert response.status_code == 200
+    assert response.json()["user"]["username"] == "after"
+    user.refresh_from_db()
+    assert (user.username, user.bio) == ("after", "second")
@@ -0,0 +1,40 @@
+import pytest
+from django.core.cache import cache
+from ninja.testing import TestClient
+from ninja_jwt.tokens import AccessToken
+
+from accounts import follows
+from accounts.models import User
+from articles.api import router
+from helpers import auth
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    auth.users.clear()
+    follows.clear()
+
+
+@pytest.fixture
+def user(django_db):
+    return User.objects.create_user(email="reader@test.test", username="reader")
+
+
+@pytest.fixture
+def author(django_db):
+    return User.objects.create_user(email="author@test.test", username="author")
+
+
+@pytest.fixture
+def client(user):
+    return TestClient(
+        router, headers={"Authorization": f"Token {AccessToken.for_user(user)}"}
+    )
+
+
+@pytest.fixture
+def author_client(author):
+    return TestClient(
+        router, headers={"Authorization": f"Token {AccessToken.for_user(author)}"}
+    )
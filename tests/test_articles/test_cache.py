@@ -0,0 +1,63 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from ninja.testing import TestClient
+
+from articles.api import router
+from articles.models import Article
+
+
+@pytest.fixture
+def article(author):
+    article = Article.objects.create(author=author, title="Cached")
+    article.tags.add("one")
+    return article
+
+
+def _get(client, slug):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(f"/articles/{slug}")
+    assert response.status_code == 200
+    return response.data["article"], len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_cached_article_only_queries_viewer_state(
+    client, user, author, article, settings
+):
+    # Views are read live; keep them from being written between the reads.
+    settings.ARTICLE_VIEWS_FLUSH_INTERVAL = 3600
+    author.followers.add(user)
+    article.favorites.add(user)
+    first, cold = _get(client, article.slug)
+    second, warm = _get(client, article.slug)
+    assert first == second
+    assert second["favorited"] is True
+    assert second["author"]["following"] is True
+    assert warm < cold
+
+
+@pytest.mark.django_db
+def test_overlay_does_not_leak_between_viewers(client, user, article):
+    article.favorites.add(user)
+    assert _get(client, article.slug)[0]["favorited"] is True
+    anonymous = TestClient(router)
+    assert _get(anonymous, article.slug)[0]["favorited"] is False
+
+
+@pytest.mark.django_db
+def test_cache_is_invalidated_on_writes(client, article):
+    _get(client, article.slug)
+    client.post(f"/articles/{article.slug}/favorite")
+    assert _get(client, article.slug)[0]["favoritesCount"] == 1
+
+    article.tags.add("two")
+    assert _get(client, article.slug)[0]["tagList"] == ["one", "two"]
+
+
+@pytest.mark.django_db
+def test_cache_is_invalidated_on_author_profile_changes(client, author, article):
+    _get(client, article.slug)
+    author.bio = "new bio"
+    author.save()
+    assert _get(client, article.slug)[0]["author"]["bio"] == "new bio"
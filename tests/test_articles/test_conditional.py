@@ -0,0 +1,125 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.test import Client
+from ninja_jwt.tokens import AccessToken
+
+from articles.models import Article
+
+
+@pytest.fixture
+def article(author):
+    return Article.objects.create(author=author, title="Polled", content="Body")
+
+
+# Django's client rather than ninja's, which does not normalize header names
+# into request.META.
+def _client(user=None):
+    if user is None:
+        return Client()
+    return Client(HTTP_AUTHORIZATION=f"Token {AccessToken.for_user(user)}")
+
+
+@pytest.fixture
+def client(user):
+    return _client(user)
+
+
+def _get(client, slug, etag=None):
+    headers = {"HTTP_IF_NONE_MATCH": etag} if etag else {}
+    return client.get(f"/api/articles/{slug}", **headers)
+
+
+def _update(client, slug, etag, **article):
+    return client.put(
+        f"/api/articles/{slug}",
+        {"article": article},
+        content_type="application/json",
+        HTTP_IF_MATCH=etag,
+    )
+
+
+@pytest.mark.django_db
+def test_unchanged_article_answers_304(client, article):
+    response = _get(client, article.slug)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    assert response["Last-Modified"]
+    assert "Authorization" in response["Vary"]
+
+    with CaptureQueriesContext(connection) as context:
+        response = _get(client, article.slug, etag)
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response["ETag"] == etag
+    # The viewer and the validators probe; nothing is rendered.
+    assert len(context.captured_queries) <= 2
+
+
+@pytest.mark.django_db
+def test_etag_follows_viewer_and_article_state(client, user, author, article):
+    etag = _get(client, article.slug)["ETag"]
+    assert _get(_client(), article.slug)["ETag"] == etag
+
+    client.post(f"/api/articles/{article.slug}/favorite")
+    response = _get(client, article.slug, etag)
+    assert response.status_code == 200
+    assert response.json()["article"]["favorited"] is True
+    assert _get(_client(), article.slug, etag).status_code == 200
+
+    etag = response["ETag"]
+    # The on-commit cache update never runs here; the probe reads the
+    # database, so the ETag and the body still see the follow.
+    author.followers.add(user)
+    response = _get(client, article.slug, etag)
+    assert response.status_code == 200
+    assert response.json()["article"]["author"]["following"] is True
+
+    etag = _get(client, article.slug)["ETag"]
+    article.tags.add("new")
+    response = _get(client, article.slug, etag)
+    assert response.status_code == 200
+    assert response.json()["article"]["tagList"] == ["new"]
+
+
+@pytest.mark.django_db
+def test_update_requires_matching_if_match(author, article):
+    author_client = _client(author)
+    etag = _get(author_client, article.slug)["ETag"]
+    response = _update(author_client, article.slug, etag, title="Renamed")
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert _get(author_client, "renamed", response["ETag"]).status_code == 304
+
+    response = _update(author_client, "renamed", etag, title="Stale write")
+    assert response.status_code == 412
+    assert Article.objects.get().title == "Renamed"
+    current = response["ETag"]
+    assert current == _get(author_client, "renamed")["ETag"]
+    response = _update(author_client, "renamed", current, title="Retried")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_profile_change_moves_etag_and_body_together(client, author, article):
+    response = _get(client, article.slug)
+    etag = response["ETag"]
+    author.bio = "Rewritten"
+    author.save()
+    response = _get(client, article.slug, etag)
+    assert response.status_code == 200
+    assert response["ETag"] != etag
+    assert response.json()["article"]["author"]["bio"] == "Rewritten"
+
+
+@pytest.mark.django_db
+def test_update_moves_updated_at(author, article):
+    author_client = _client(author)
+    before = article.updated_at
+    author_client.put(
+        f"/api/articles/{article.slug}",
+        {"article": {"description": "New"}},
+        content_type="application/json",
+    )
+    article.refresh_from_db()
+    assert article.updated_at > before
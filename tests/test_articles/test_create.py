@@ -0,0 +1,65 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from articles.models import Article, TagUsage
+from taggit.models import Tag
+
+
+def _create(client, title, tags):
+    return client.post(
+        "/articles",
+        json={
+            "article": {
+                "title": title,
+                "description": "d",
+                "body": "b",
+                "tagList": tags,
+            }
+        },
+    )
+
+
+@pytest.mark.django_db
+def test_create_article_resolves_tags_in_bulk(author_client):
+    Tag.objects.create(name="existing")
+    tags = ["existing", *[f"new{i}" for i in range(9)], "new0"]
+    with CaptureQueriesContext(connection) as context:
+        response = _create(author_client, "Many tags", tags)
+    assert response.status_code == 201
+    assert sorted(response.data["article"]["tagList"]) == sorted(set(tags))
+    assert response.data["article"]["favorited"] is False
+    assert len(context.captured_queries) < 20
+
+    article = Article.objects.get(slug="many-tags")
+    assert {t.name for t in article.tags.all()} == set(tags)
+    assert TagUsage.objects.get(tag__name="existing").count == 1
+
+
+@pytest.mark.django_db
+def test_create_article_with_colliding_tag_slug(author_client):
+    Tag.objects.create(name="Python", slug="python")
+    response = _create(author_client, "Collide", ["python"])
+    assert response.status_code == 201
+    assert response.data["article"]["tagList"] == ["python"]
+
+
+@pytest.mark.django_db
+def test_create_article_with_taken_title(author_client):
+    assert _create(author_client, "Same title", []).status_code == 201
+    response = _create(author_client, "Same title", [])
+    assert response.status_code == 409
+    assert response.json() == {"already_existing": "title"}
+    response = _create(author_client, "same TITLE", [])
+    assert response.status_code == 409
+    assert response.json() == {"already_existing": "slug"}
+
+
+@pytest.mark.django_db
+def test_reserved_slugs_do_not_shadow_routes(client, author):
+    for title in ("Search", "Import", "Feed"):
+        article = Article.objects.create(author=author, title=title)
+        assert article.slug == f"{title.lower()}-article"
+        response = client.get(f"/articles/{article.slug}")
+        assert response.status_code == 200
+        assert response.data["article"]["title"] == title
@@ -0,0 +1,80 @@
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from articles import deletion, timeline
+from articles.models import Article, TagUsage, TimelineEntry
+from comments.models import Comment
+
+
+@pytest.fixture
+def article(user, author):
+    article = Article.objects.create(author=author, title="Doomed", content="gone")
+    article.tags.add("doomed")
+    article.favorites.add(user)
+    author.followers.add(user)
+    timeline.backfill(user, author)
+    Comment.objects.bulk_create(
+        [Comment(user=user, article=article, text=f"c{i}") for i in range(5)]
+    )
+    return article
+
+
+@pytest.mark.django_db
+def test_delete_hides_article_without_cascading(client, author_client, article):
+    with CaptureQueriesContext(connection) as context:
+        response = author_client.delete(f"/articles/{article.slug}")
+    assert response.status_code == 204
+    assert not any(
+        "DELETE" in q["sql"] and "comments_comment" in q["sql"]
+        for q in context.captured_queries
+    )
+    assert Comment.objects.count() == 5
+
+    assert client.get(f"/articles/{article.slug}").status_code == 404
+    assert client.get("/articles").json()["articlesCount"] == 0
+    assert client.get("/articles?tag=doomed").json()["articles"] == []
+    assert client.get("/articles/feed").json()["articlesCount"] == 0
+    assert client.get("/articles/search?q=gone").json()["articles"] == []
+    assert client.post(f"/articles/{article.slug}/favorite").status_code == 404
+    assert TagUsage.objects.get(tag__name="doomed").count == 0
+    assert author_client.delete(f"/articles/{article.slug}").status_code == 404
+
+
+@pytest.mark.django_db
+def test_purge_removes_dependents_in_chunks(article, capsys):
+    kept = Article.objects.create(author=article.author, title="Kept")
+    kept.tags.add("doomed")
+    deletion.soft_delete(article)
+    with CaptureQueriesContext(connection) as context:
+        call_command("purge_deleted_articles", "--batch-size", "2")
+    assert "Purged 1 article(s)." in capsys.readouterr().out
+    comment_deletes = [
+        q
+        for q in context.captured_queries
+        if q["sql"].startswith(
+            'DELETE FROM "comments_comment" WHERE "comments_comment"."id"'
+        )
+    ]
+    assert len(comment_deletes) == 3
+
+    assert list(Article.all_objects.all()) == [kept]
+    assert Comment.objects.count() == 0
+    assert TimelineEntry.objects.count() == 0
+    assert Article.favorites.through.objects.count() == 0
+    assert list(kept.tags.names()) == ["doomed"]
+    assert TagUsage.objects.get(tag__name="doomed").count == 1
+
+
+@pytest.mark.django_db
+def test_deleted_title_can_be_reused_at_once(client, author_client, article):
+    author_client.delete(f"/articles/{article.slug}")
+    body = {"article": {"title": "Doomed", "description": "d", "body": "b"}}
+    response = author_client.post("/articles", json=body)
+    assert response.status_code == 201
+    assert response.json()["article"]["slug"] == "doomed"
+    assert client.get("/articles/doomed").json()["article"]["description"] == "d"
+    assert author_client.post("/articles", json=body).status_code == 409
+    assert deletion.purge(batch_size=100) == 1
+    assert Article.objects.get().slug == "doomed"
@@ -0,0 +1,74 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from articles.models import Article
+
+
+@pytest.fixture
+def article(author):
+    return Article.objects.create(author=author, title="Favorited")
+
+
+@pytest.mark.django_db
+def test_favorite_and_unfavorite_keep_counter(client, article):
+    for _ in range(2):
+        response = client.post(f"/articles/{article.slug}/favorite")
+        assert response.status_code == 200
+        assert response.data["article"]["favorited"] is True
+        assert response.data["article"]["favoritesCount"] == 1
+    article.refresh_from_db()
+    assert article.favorites_count == 1
+
+    for _ in range(2):
+        response = client.delete(f"/articles/{article.slug}/favorite")
+        assert response.status_code == 200
+        assert response.data["article"]["favorited"] is False
+        assert response.data["article"]["favoritesCount"] == 0
+    article.refresh_from_db()
+    assert article.favorites_count == 0
+
+
+@pytest.mark.django_db
+def test_favorite_writes_without_refetching(client, article):
+    client.get(f"/articles/{article.slug}")
+    client.post(f"/articles/{article.slug}/favorite")
+    # A state change leaves the cached rendering in place.
+    with CaptureQueriesContext(connection) as context:
+        client.delete(f"/articles/{article.slug}/favorite")
+        response = client.post(f"/articles/{article.slug}/favorite")
+    assert response.data["article"]["favoritesCount"] == 1
+    statements = [q["sql"].split()[0] for q in context.captured_queries]
+    assert statements.count("INSERT") == 1
+    assert statements.count("DELETE") == 1
+    assert statements.count("UPDATE") == 2
+    assert not any(
+        "articles_article" in q["sql"] and q["sql"].startswith("SELECT")
+        for q in context.captured_queries
+    )
+
+
+@pytest.mark.django_db
+def test_favorite_unknown_article(client):
+    assert client.post("/articles/missing/favorite").status_code == 404
+
+
+@pytest.mark.django_db
+def test_list_does_not_group_by_favorites(client, article):
+    with CaptureQueriesContext(connection) as context:
+        client.get("/articles")
+    assert not any("GROUP BY" in q["sql"] for q in context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_reconcile_favorites_count(article, user):
+    article.favorites.add(user)
+    Article.objects.filter(pk=article.pk).update(favorites_count=7)
+    out = StringIO()
+    call_command("reconcile_favorites_count", stdout=out)
+    article.refresh_from_db()
+    assert article.favorites_count == 1
+    assert "Reconciled 1 article(s)." in out.getvalue()
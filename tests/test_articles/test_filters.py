@@ -0,0 +1,46 @@
+import re
+
+import pytest
+
+from accounts.models import User
+from articles.filters import ArticleFilter
+from articles.models import Article
+
+
+@pytest.fixture
+def articles(author, user):
+    tagged = Article.objects.create(author=author, title="Tagged")
+    tagged.tags.add("python")
+    favorited = Article.objects.create(author=user, title="Favorited")
+    favorited.favorites.add(author)
+    return tagged, favorited
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "query, expected",
+    [
+        ("tag=python", ["tagged"]),
+        ("tag=pyth", []),
+        ("author=author", ["tagged"]),
+        ("author=auth", []),
+        ("favorited=author", ["favorited"]),
+        ("author=reader&favorited=author", ["favorited"]),
+    ],
+)
+def test_list_articles_filters(client, articles, query, expected):
+    response = client.get(f"/articles?{query}")
+    assert response.status_code == 200
+    assert [a["slug"] for a in response.data["articles"]] == expected
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", ["tag", "author", "favorited"])
+def test_filters_use_indexes(articles, name):
+    viewer = User.objects.get(username="reader")
+    queryset = ArticleFilter(
+        {name: "value"}, queryset=Article.objects.with_favorites(viewer)
+    ).qs.order_by("-created_at", "-id")
+    plan = queryset.explain()
+    assert "USING" in plan
+    assert not re.search(r"\bSCAN\b", plan), plan
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+from ninja_jwt.tokens import AccessToken
+
+from articles import deletion
+from articles.models import Article, TagUsage, TimelineEntry
+
+
+def _line(title, tags=()):
+    return json.dumps(
+        {"title": title, "description": "d", "body": f"*{title}*", "tagList": tags}
+    )
+
+
+def _import(user, lines, **params):
+    query = "&".join(f"{k}={v}" for k, v in params.items())
+    return Client().post(
+        f"/api/articles/import?{query}",
+        data="\n".join(lines) + "\n",
+        content_type="application/x-ndjson",
+        HTTP_AUTHORIZATION=f"Token {AccessToken.for_user(user)}",
+    )
+
+
+@pytest.mark.django_db
+def test_import_creates_articles_in_batches(user, author):
+    author.followers.add(user)
+    lines = [_line(f"Imported {i}", ["shared", f"tag{i % 2}"]) for i in range(5)]
+    response = _import(author, lines, batch_size=2)
+    assert response.status_code == 200
+    assert response.json() == {"created": 5, "failed": 0, "errors": []}
+
+    article = Article.objects.get(slug="imported-3")
+    assert article.author == author
+    assert article.content_html == "<p><em>Imported 3</em></p>"
+    assert {t.name for t in article.tags.all()} == {"shared", "tag1"}
+    assert TagUsage.objects.get(tag__name="shared").count == 5
+    assert TimelineEntry.objects.filter(user=user).count() == 5
+
+
+@pytest.mark.django_db
+def test_import_reports_per_line_errors(author):
+    Article.objects.create(author=author, title="Taken", summary="s", content="c")
+    lines = [
+        _line("Fine"),
+        "{not json",
+        json.dumps({"title": "No body", "description": "d"}),
+        "",
+        _line("Taken"),
+        _line("Fine"),
+        _line("Also fine"),
+    ]
+    response = _import(author, lines)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["failed"]) == (2, 4)
+    assert [e["line"] for e in body["errors"]] == [2, 3, 5, 6]
+    assert "body" in body["errors"][1]["msg"]
+    assert body["errors"][2]["msg"] == "already_existing: title"
+    assert set(Article.objects.values_list("title", flat=True)) == {
+        "Taken",
+        "Fine",
+        "Also fine",
+    }
+
+
+@pytest.mark.django_db
+def test_import_reuses_deleted_titles(author):
+    deletion.soft_delete(Article.objects.create(author=author, title="Gone"))
+    response = _import(author, [_line("Gone")])
+    assert response.json() == {"created": 1, "failed": 0, "errors": []}
+    assert Article.objects.get().slug == "gone"
+
+
+@pytest.mark.django_db
+def test_import_requires_authentication():
+    response = Client().post(
+        "/api/articles/import", data=_line("x"), content_type="application/x-ndjson"
+    )
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_import_command(author, tmp_path, capsys):
+    path = tmp_path / "articles.ndjson"
+    path.write_text("\n".join([_line("From file", ["cli"]), "[]"]) + "\n")
+    call_command("import_articles", str(path), "--author", author.email)
+    out, err = capsys.readouterr()
+    assert "Imported 1 article(s), 1 failed." in out
+    assert "line 2:" in err
+    assert Article.objects.get(slug="from-file").tags.get().name == "cli"
@@ -0,0 +1,40 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from articles.models import Article
+
+
+def _create_articles(count, start=0):
+    for i in range(start, start + count):
+        author = User.objects.create_user(
+            email=f"writer{i}@test.test", username=f"writer{i}"
+        )
+        article = Article.objects.create(author=author, title=f"Loaded {i}")
+        article.tags.add("shared", f"tag{i}")
+
+
+def _count_queries(client, url):
+    with CaptureQueriesContext(connection) as context:
+        response = client.get(url)
+    assert response.status_code == 200
+    return len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_list_query_count_does_not_grow_with_page_size(client, user):
+    _create_articles(2)
+    _count_queries(client, "/articles")  # warms the authenticated user cache
+    small = _count_queries(client, "/articles")
+    _create_articles(10, start=2)
+    assert _count_queries(client, "/articles") == small
+
+
+@pytest.mark.django_db
+def test_loaded_relations_are_rendered(client, user):
+    _create_articles(2)
+    User.objects.get(username="writer1").followers.add(user)
+    articles = client.get("/articles").data["articles"]
+    assert [a["tagList"] for a in articles] == [["shared", "tag1"], ["shared", "tag0"]]
+    assert [a["author"]["following"] for a in articles] == [True, False]
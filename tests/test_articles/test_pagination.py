@@ -0,0 +1,92 @@
+from datetime import timedelta
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+
+from articles import timeline
+from articles.models import Article
+from helpers.pagination import count_key, decode_cursor, encode_cursor
+
+
+@pytest.fixture
+def articles(author):
+    now = timezone.now()
+    articles = [
+        Article.objects.create(author=author, title=f"Title {i}", content="c")
+        for i in range(5)
+    ]
+    # Two articles share a timestamp so the id tie-breaker is exercised.
+    for i, article in enumerate(articles):
+        article.created_at = now + timedelta(seconds=min(i, 3))
+    Article.objects.bulk_update(articles, ["created_at"])
+    return articles
+
+
+def test_cursor_round_trip():
+    now = timezone.now()
+    assert decode_cursor(encode_cursor(now, 42)) == (now, 42)
+
+
+@pytest.mark.django_db
+def test_list_articles_walks_all_pages(client, articles):
+    slugs, cursor = [], None
+    while True:
+        response = client.get(
+            "/articles?limit=2" + (f"&cursor={cursor}" if cursor else "")
+        )
+        assert response.status_code == 200
+        assert len(response.data["articles"]) <= 2
+        slugs += [a["slug"] for a in response.data["articles"]]
+        cursor = response.data["nextCursor"]
+        if cursor is None:
+            break
+    assert slugs == [a.slug for a in reversed(articles)]
+
+
+@pytest.mark.django_db
+def test_feed_is_paginated(client, user, author, articles):
+    author.followers.add(user)
+    timeline.backfill(user, author)
+    response = client.get("/articles/feed?limit=3")
+    assert response.status_code == 200
+    assert [a["slug"] for a in response.data["articles"]] == [
+        "title-4",
+        "title-3",
+        "title-2",
+    ]
+    assert response.data["nextCursor"] is not None
+
+
+@pytest.mark.django_db
+def test_page_size_is_bounded(client, articles):
+    assert client.get("/articles?limit=1000").status_code == 422
+
+
+@pytest.mark.django_db
+def test_invalid_cursor(client, articles):
+    assert client.get("/articles?cursor=not-a-cursor").status_code == 400
+
+
+@pytest.mark.django_db
+def test_articles_count_is_the_total(client, user, author, articles):
+    response = client.get("/articles?limit=2&author=author")
+    assert response.data["articlesCount"] == 5
+    author.followers.add(user)
+    timeline.backfill(user, author)
+    assert client.get("/articles/feed?limit=2").data["articlesCount"] == 5
+
+
+@pytest.mark.django_db
+@override_settings(LARGE_COUNT_THRESHOLD=3)
+def test_large_counts_are_cached(client, author, articles):
+    assert client.get("/articles").data["articlesCount"] == 5
+    Article.objects.create(author=author, title="Late")
+    assert client.get("/articles").data["articlesCount"] == 5
+
+
+def test_count_keys_are_normalized_and_bounded():
+    key = count_key("articles:count", tag="x" * 10000, author=None, favorited="")
+    assert key == count_key("articles:count", tag="x" * 10000)
+    assert len(key) < 64
+    assert count_key("c", tag="a", author="b") == count_key("c", author="b", tag="a")
@@ -0,0 +1,64 @@
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory
+from ninja.renderers import JSONRenderer
+
+from accounts.models import User
+from accounts.schemas import PROFILE_FIELDS, ProfileSchema, profile_from_row
+from articles.loaders import project_articles, serialize_articles
+from articles.models import Article
+from articles.schemas import ARTICLE_FIELDS
+from helpers.renderers import ORJSONRenderer
+
+
+@pytest.fixture
+def articles(user, author):
+    other = User.objects.create_user(
+        email="other@test.test", username="other", bio="Bio", image="http://i/x.png"
+    )
+    author.followers.add(user)
+    articles = []
+    for i, writer in enumerate([author, other, author]):
+        article = Article.objects.create(
+            author=writer, title=f"Projected {i}", summary=f"s{i}", content=f"*{i}*"
+        )
+        article.tags.add(*[f"t{j}" for j in range(i)])
+        articles.append(article)
+    articles[1].favorites.add(user)
+    articles[1].favorites_count = 1
+    articles[1].save(update_fields=["favorites_count"])
+    return articles
+
+
+def _request(viewer):
+    request = RequestFactory().get("/")
+    request.user = viewer
+    return request
+
+
+def _render(data):
+    return [
+        renderer.render(None, data, response_status=200)
+        for renderer in (JSONRenderer(), ORJSONRenderer())
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("authenticated", [True, False])
+def test_projection_matches_article_schema(user, articles, authenticated):
+    request = _request(user if authenticated else AnonymousUser())
+    queryset = Article.objects.with_favorites(request.user).order_by("-id")
+    schemas = serialize_articles(request, queryset)
+    projected = project_articles(request, queryset.values(*ARTICLE_FIELDS))
+    assert _render({"articles": projected}) == _render({"articles": schemas})
+    assert _render(projected) == _render([schema.model_dump() for schema in schemas])
+
+
+@pytest.mark.django_db
+def test_projection_matches_profile_schema(user, author, articles):
+    request = _request(user)
+    for profile in User.objects.exclude(id=user.id):
+        row = User.objects.values(*PROFILE_FIELDS).get(id=profile.id)
+        following = profile.followers.filter(id=user.id).exists()
+        schema = ProfileSchema.from_orm(profile, context={"request": request})
+        assert _render(profile_from_row(row, following)) == _render(schema)
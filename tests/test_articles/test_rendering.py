@@ -0,0 +1,66 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.test import Client
+
+from articles.models import Article
+
+
+@pytest.mark.django_db
+def test_html_is_rendered_on_save_only_when_content_changes(author, monkeypatch):
+    article = Article.objects.create(author=author, title="Md", content="*hi*")
+    assert article.content_html == "<p><em>hi</em></p>"
+
+    calls = []
+    monkeypatch.setattr(
+        "articles.models.render_markdown", lambda text: calls.append(text) or text
+    )
+    article.summary = "changed"
+    article.save()
+    assert calls == []
+    article.content = "new"
+    article.save(update_fields=["content"])
+    assert calls == ["new"]
+    article.refresh_from_db()
+    assert article.content_html == "new"
+
+
+@pytest.mark.django_db
+def test_stored_html_is_served_without_rendering(author, monkeypatch):
+    article = Article.objects.create(author=author, title="Served", content="*a*")
+    monkeypatch.setattr(
+        "articles.models.render_markdown", lambda text: pytest.fail("rendered")
+    )
+    response = Client().get(f"/api/articles/{article.slug}/html")
+    assert response.status_code == 200
+    assert response["Content-Type"] == "text/html; charset=utf-8"
+    assert response.content == b"<p><em>a</em></p>"
+
+
+@pytest.mark.django_db
+def test_html_from_another_renderer_is_stale(author, monkeypatch):
+    article = Article.objects.create(author=author, title="Old", content="*a*")
+    monkeypatch.setattr("articles.rendering.FINGERPRINT", "0" * 16)
+    Article.objects.filter(pk=article.pk).update(content_html="stale")
+    article = Article.objects.get(pk=article.pk)
+    assert article.as_markdown() == "<p><em>a</em></p>"
+    article.content = "*b*"
+    assert article.as_markdown() == "<p><em>b</em></p>"
+
+
+@pytest.mark.django_db
+def test_raw_html_is_escaped(author):
+    article = Article.objects.create(author=author, title="Xss", content="<b>x</b>")
+    assert article.as_markdown() == "<p>&lt;b&gt;x&lt;/b&gt;</p>"
+
+
+@pytest.mark.django_db
+def test_render_markdown_command(author):
+    article = Article.objects.create(author=author, title="Stale", content="*a*")
+    Article.objects.filter(pk=article.pk).update(content_html="", content_hash="")
+    out = StringIO()
+    call_command("render_markdown", "--workers=1", stdout=out)
+    article.refresh_from_db()
+    assert article.content_html == "<p><em>a</em></p>"
+    assert "Rendered 1 article(s)." in out.getvalue()
@@ -0,0 +1,97 @@
+import pytest
+from django.core.management import call_command
+
+from articles.models import Article
+
+
+@pytest.fixture
+def articles(author):
+    return [
+        Article.objects.create(
+            author=author,
+            title="Running a marathon",
+            summary="Training plans",
+            content="Long runs on weekends.",
+        ),
+        Article.objects.create(
+            author=author,
+            title="Cooking pasta",
+            summary="Dinner",
+            content="Boil water, then go running while it cooks.",
+        ),
+        Article.objects.create(
+            author=author, title="Gardening", summary="Spring", content="Tomatoes."
+        ),
+    ]
+
+
+def _titles(response):
+    return [a["title"] for a in response.json()["articles"]]
+
+
+@pytest.mark.django_db
+def test_search_ranks_title_matches_first(client, articles):
+    response = client.get("/articles/search?q=run")
+    assert response.status_code == 200
+    assert _titles(response) == ["Running a marathon", "Cooking pasta"]
+    assert response.json()["articlesCount"] == 2
+    assert response.json()["articles"][0]["favorited"] is False
+
+
+@pytest.mark.django_db
+def test_search_requires_every_word(client, articles):
+    assert _titles(client.get("/articles/search?q=running+pasta")) == ["Cooking pasta"]
+    # FTS query syntax is not interpreted.
+    assert _titles(client.get('/articles/search?q="pasta" -cooking*(')) == [
+        "Cooking pasta"
+    ]
+    assert _titles(client.get("/articles/search?q=%2A%2A")) == []
+
+
+@pytest.mark.django_db
+def test_search_is_cursor_paginated(client, author):
+    for i in range(5):
+        Article.objects.create(
+            author=author, title=f"Post {i}", summary="", content="shared words"
+        )
+    seen, cursor = [], ""
+    while True:
+        response = client.get(f"/articles/search?q=shared&limit=2&cursor={cursor}")
+        seen += _titles(response)
+        cursor = response.json()["nextCursor"]
+        if cursor is None:
+            break
+    assert sorted(seen) == [f"Post {i}" for i in range(5)]
+    assert client.get("/articles/search?q=shared&cursor=xyz").status_code == 400
+
+
+@pytest.mark.django_db
+def test_index_follows_updates_and_deletes(client, articles):
+    article = articles[2]
+    article.content = "Growing cucumbers."
+    article.save(update_fields=["content"])
+    assert _titles(client.get("/articles/search?q=cucumber")) == ["Gardening"]
+    assert _titles(client.get("/articles/search?q=tomatoes")) == []
+    article.delete()
+    assert _titles(client.get("/articles/search?q=cucumber")) == []
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index(client, articles, capsys):
+    call_command("rebuild_search_index")
+    assert "Indexed 3 article(s)." in capsys.readouterr().out
+    assert _titles(client.get("/articles/search?q=tomatoes")) == ["Gardening"]
+
+
+@pytest.mark.django_db
+def test_search_falls_back_to_a_scan_without_an_index(client, articles, monkeypatch):
+    monkeypatch.setattr("articles.search.CREATE_STATEMENTS", {})
+    response = client.get("/articles/search?q=run&limit=1")
+    assert response.status_code == 200
+    assert _titles(response) == ["Cooking pasta"]
+    assert response.json()["articlesCount"] == 2
+    cursor = response.json()["nextCursor"]
+    response = client.get(f"/articles/search?q=run&limit=1&cursor={cursor}")
+    assert _titles(response) == ["Running a marathon"]
+    assert response.json()["nextCursor"] is None
+    assert _titles(client.get("/articles/search?q=running+pasta")) == ["Cooking pasta"]
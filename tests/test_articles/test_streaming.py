@@ -0,0 +1,95 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+from django.test import AsyncClient, Client
+from django.test.utils import CaptureQueriesContext
+from ninja_jwt.tokens import AccessToken
+
+from articles import timeline
+from articles.models import Article
+
+
+@pytest.fixture
+def http(user):
+    return Client(HTTP_AUTHORIZATION=f"Token {AccessToken.for_user(user)}")
+
+
+@pytest.fixture
+def articles(author):
+    articles = [
+        Article.objects.create(author=author, title=f"Streamed {i}") for i in range(7)
+    ]
+    for article in articles:
+        article.tags.add("stream", f"n{article.id % 2}")
+    return articles
+
+
+def _stream(http, path):
+    with CaptureQueriesContext(connection) as context:
+        response = http.get(path)
+        assert response.streaming
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+    return json.loads("".join(chunks)), chunks, len(context.captured_queries)
+
+
+@pytest.mark.django_db
+def test_streamed_list_matches_pages(http, articles, settings):
+    settings.ARTICLES_STREAM_CHUNK_SIZE = 3
+    body, chunks, queries = _stream(http, "/api/articles?stream=true")
+    paged = http.get("/api/articles?limit=100").json()
+    assert body == {
+        "articlesCount": 7,
+        "articles": paged["articles"],
+    }
+    # Envelope head, one chunk per 3 articles, envelope tail.
+    assert len(chunks) == 5
+
+    settings.ARTICLES_STREAM_CHUNK_SIZE = 1
+    assert _stream(http, "/api/articles?stream=true")[2] > queries
+
+
+@pytest.mark.django_db
+def test_streamed_list_honours_filters_and_cursor(http, articles):
+    page = http.get("/api/articles?limit=2").json()
+    body, _, _ = _stream(
+        http, f"/api/articles?stream=true&cursor={page['nextCursor']}&tag=stream"
+    )
+    assert [a["title"] for a in body["articles"]] == [
+        f"Streamed {i}" for i in range(4, -1, -1)
+    ]
+    body, _, _ = _stream(http, "/api/articles?stream=true&tag=missing")
+    assert body == {"articlesCount": 0, "articles": []}
+    assert http.get("/api/articles?stream=true&cursor=xyz").status_code == 400
+
+
+@pytest.mark.django_db
+def test_streamed_feed(http, user, author, articles, settings):
+    settings.ARTICLES_STREAM_CHUNK_SIZE = 2
+    author.followers.add(user)
+    timeline.backfill(user, author)
+    body, _, _ = _stream(http, "/api/articles/feed?stream=true")
+    assert body["articlesCount"] == 7
+    assert [a["title"] for a in body["articles"]] == [
+        f"Streamed {i}" for i in range(6, -1, -1)
+    ]
+
+
+@pytest.mark.django_db
+def test_asgi_stream_is_sent_chunk_by_chunk(user, articles, settings):
+    settings.ARTICLES_STREAM_CHUNK_SIZE = 3
+    http = AsyncClient(HTTP_AUTHORIZATION=f"Token {AccessToken.for_user(user)}")
+
+    async def stream():
+        response = await http.get("/api/articles?stream=true")
+        # An async body, so the handler does not list() it first.
+        assert response.is_async
+        return [chunk async for chunk in response.streaming_content]
+
+    chunks = async_to_sync(stream)()
+    assert len(chunks) == 5
+    body = json.loads(b"".join(chunks))
+    assert [a["title"] for a in body["articles"]] == [
+        f"Streamed {i}" for i in range(6, -1, -1)
+    ]
@@ -0,0 +1,46 @@
+from io import StringIO
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+
+from articles.models import Article, TagUsage
+from articles.tags import POPULAR_TAGS_CACHE_KEY
+
+
+def _usage():
+    return dict(TagUsage.objects.values_list("tag__name", "count"))
+
+
+@pytest.mark.django_db
+def test_usage_follows_tag_changes(author):
+    first = Article.objects.create(author=author, title="First")
+    second = Article.objects.create(author=author, title="Second")
+    first.tags.add("python", "django")
+    second.tags.add("python")
+    assert _usage() == {"python": 2, "django": 1}
+
+    first.tags.remove("django")
+    second.tags.clear()
+    assert _usage() == {"python": 1, "django": 0}
+
+    first.delete()
+    assert _usage() == {"python": 0, "django": 0}
+
+
+@pytest.mark.django_db
+def test_popular_tags_endpoint(client, author):
+    for i, tags in enumerate([["a", "b"], ["a"], ["a", "c", "b"]]):
+        Article.objects.create(author=author, title=f"Tagged {i}").tags.add(*tags)
+    response = client.get("/tags?limit=2")
+    assert response.status_code == 200
+    assert response.data == {"tags": ["a", "b"]}
+    assert cache.get(POPULAR_TAGS_CACHE_KEY) == ["a", "b", "c"]
+
+
+@pytest.mark.django_db
+def test_rebuild_tag_usage(author):
+    Article.objects.create(author=author, title="Rebuilt").tags.add("x")
+    TagUsage.objects.update(count=5)
+    call_command("rebuild_tag_usage", stdout=StringIO())
+    assert _usage() == {"x": 1}
@@ -0,0 +1,106 @@
+import pytest
+from django.test import override_settings
+from ninja.testing import TestClient
+from ninja_jwt.tokens import AccessToken
+
+from accounts.api import router as accounts_router
+from articles.api import router as articles_router
+from accounts.models import User
+from articles import timeline
+from articles.models import Article, TimelineEntry
+
+
+@pytest.fixture
+def accounts_client(user):
+    return TestClient(
+        accounts_router,
+        headers={"Authorization": f"Token {AccessToken.for_user(user)}"},
+    )
+
+
+@pytest.mark.django_db
+def test_follow_backfills_and_unfollow_prunes(client, accounts_client, user, author):
+    Article.objects.create(author=author, title="Older post")
+    assert client.get("/articles/feed").data["articles"] == []
+
+    assert (
+        accounts_client.post(f"/profiles/{author.username}/follow").status_code == 200
+    )
+    feed = client.get("/articles/feed").data["articles"]
+    assert [a["slug"] for a in feed] == ["older-post"]
+
+    assert (
+        accounts_client.delete(f"/profiles/{author.username}/follow").status_code == 200
+    )
+    assert client.get("/articles/feed").data["articles"] == []
+    assert not TimelineEntry.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_create_article_fans_out_to_followers(user, author):
+    author.followers.add(user)
+    articles_client = TestClient(
+        articles_router,
+        headers={"Authorization": f"Token {AccessToken.for_user(author)}"},
+    )
+    response = articles_client.post(
+        "/articles",
+        json={"article": {"title": "Fresh", "description": "d", "body": "b"}},
+    )
+    assert response.status_code == 201
+    assert list(
+        TimelineEntry.objects.filter(user=user).values_list("article__slug", flat=True)
+    ) == ["fresh"]
+
+
+@pytest.mark.django_db
+@override_settings(TIMELINE_MAX_LENGTH=2)
+def test_timeline_is_capped(accounts_client, user, author):
+    for i in range(4):
+        Article.objects.create(author=author, title=f"Post {i}")
+    accounts_client.post(f"/profiles/{author.username}/follow")
+    assert list(
+        TimelineEntry.objects.filter(user=user)
+        .order_by("-created_at")
+        .values_list("article__slug", flat=True)
+    ) == ["post-3", "post-2"]
+
+
+def _timeline(user):
+    return list(
+        TimelineEntry.objects.filter(user=user)
+        .order_by("-created_at")
+        .values_list("article__slug", flat=True)
+    )
+
+
+@pytest.mark.django_db
+def test_fan_out_trims_later_in_chunks(
+    user, author, settings, django_capture_on_commit_callbacks
+):
+    settings.TIMELINE_MAX_LENGTH = 2
+    settings.TIMELINE_TRIM_CHUNK = 1
+    settings.TIMELINE_TRIM_INTERVAL = 3600
+    other = User.objects.create_user(email="other@test.test", username="other")
+    author.followers.add(user, other)
+    timeline.trims.flush()
+    for i in range(3):
+        with django_capture_on_commit_callbacks(execute=True):
+            timeline.fan_out(Article.objects.create(author=author, title=f"Post {i}"))
+    # Publishing only recorded the followers.
+    assert len(_timeline(user)) == 3
+    assert timeline.trims.flush() == 2
+    assert _timeline(user) == _timeline(other) == ["post-2", "post-1"]
+
+
+@pytest.mark.django_db
+def test_due_trim_runs_on_publish(
+    user, author, settings, django_capture_on_commit_callbacks
+):
+    settings.TIMELINE_MAX_LENGTH = 1
+    settings.TIMELINE_TRIM_INTERVAL = 0
+    author.followers.add(user)
+    for i in range(2):
+        with django_capture_on_commit_callbacks(execute=True):
+            timeline.fan_out(Article.objects.create(author=author, title=f"Post {i}"))
+    assert _timeline(user) == ["post-1"]
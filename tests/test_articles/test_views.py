@@ -0,0 +1,99 @@
+import threading
+
+import pytest
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
+
+from articles.counters import ViewCounter, views
+from articles.models import Article
+
+
+@pytest.fixture
+def articles(author):
+    # Hits buffered by earlier tests would land on recycled ids.
+    views.flush()
+    return [
+        Article.objects.create(author=author, title=f"Viewed {i}") for i in range(3)
+    ]
+
+
+@pytest.mark.django_db
+def test_hits_are_written_behind_in_batches(articles, settings):
+    settings.ARTICLE_VIEWS_FLUSH_EVENTS = 100
+    counter = ViewCounter()
+    with CaptureQueriesContext(connection) as context:
+        for article, hits in zip(articles, [3, 3, 1]):
+            for _ in range(hits):
+                counter.hit(article.id)
+    assert context.captured_queries == []
+
+    with CaptureQueriesContext(connection) as context:
+        assert counter.flush() == 7
+    assert len(context.captured_queries) == 2
+    assert [a.views_count for a in Article.objects.order_by("id")] == [3, 3, 1]
+    assert counter.flush() == 0
+
+
+@pytest.mark.django_db
+def test_flush_after_max_events_or_interval(articles, settings):
+    settings.ARTICLE_VIEWS_FLUSH_EVENTS = 3
+    counter = ViewCounter()
+    for _ in range(3):
+        counter.hit(articles[0].id)
+    articles[0].refresh_from_db()
+    assert articles[0].views_count == 3
+
+    settings.ARTICLE_VIEWS_FLUSH_EVENTS = 100
+    settings.ARTICLE_VIEWS_FLUSH_INTERVAL = 0
+    counter.hit(articles[1].id)
+    articles[1].refresh_from_db()
+    assert articles[1].views_count == 1
+
+
+@pytest.mark.django_db
+def test_retrieve_counts_views(client, articles, settings):
+    settings.ARTICLE_VIEWS_FLUSH_EVENTS = 100
+    slug = articles[0].slug
+    assert client.get(f"/articles/{slug}").json()["article"]["viewsCount"] == 0
+    client.get(f"/articles/{slug}")
+    assert Article.objects.get(slug=slug).views_count == 0
+
+    views.flush()
+    assert Article.objects.get(slug=slug).views_count == 2
+    listed = client.get("/articles").json()["articles"]
+    assert {a["slug"]: a["viewsCount"] for a in listed}[slug] == 2
+    # The cached rendering still says 0; the probe supplies the count.
+    response = client.get(f"/articles/{slug}")
+    assert response.json()["article"]["viewsCount"] == 2
+    assert response["ETag"] == client.get(f"/articles/{slug}")["ETag"]
+
+
+@pytest.mark.django_db
+def test_failed_flush_keeps_hits_and_does_not_fail_the_request(
+    client, articles, settings, monkeypatch
+):
+    settings.ARTICLE_VIEWS_FLUSH_EVENTS = 1
+
+    def broken(*args, **kwargs):
+        raise DatabaseError("unavailable")
+
+    monkeypatch.setattr(Article.all_objects, "filter", broken)
+    assert client.get(f"/articles/{articles[0].slug}").status_code == 200
+    monkeypatch.undo()
+    assert views.flush() == 1
+    articles[0].refresh_from_db()
+    assert articles[0].views_count == 1
+
+
+def test_background_flush_writes_idle_hits(settings, monkeypatch):
+    settings.ARTICLE_VIEWS_FLUSH_IN_BACKGROUND = True
+    settings.ARTICLE_VIEWS_FLUSH_EVENTS = 100
+    settings.ARTICLE_VIEWS_FLUSH_INTERVAL = 0.05
+    flushed = threading.Event()
+    counter = ViewCounter(background=True)
+    monkeypatch.setattr(counter, "flush_quietly", flushed.set)
+    counter.hit(1)
+    try:
+        assert flushed.wait(timeout=5)
+    finally:
+        counter.stop()
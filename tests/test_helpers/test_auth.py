@@ -0,0 +1,104 @@
+from hashlib import sha256
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from ninja_jwt.exceptions import AuthenticationFailed, InvalidToken, TokenError
+from ninja_jwt.tokens import AccessToken
+
+from accounts.models import User
+from helpers import auth
+from helpers.lru import LRUCache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    auth.users.clear()
+    auth.tokens.clear()
+    yield
+    auth.users.clear()
+    auth.tokens.clear()
+
+
+@pytest.fixture
+def user(django_db):
+    return User.objects.create_user(email="cached@test.test", username="cached")
+
+
+def _resolve(user):
+    return auth.AuthJWT().get_user(AccessToken.for_user(user))
+
+
+@pytest.mark.django_db
+def test_cached_user_skips_the_database(user):
+    assert _resolve(user) == user
+    with CaptureQueriesContext(connection) as queries:
+        cached = _resolve(user)
+    assert len(queries) == 0
+    assert cached == user
+    assert cached.username == "cached"
+    assert cached is not _resolve(user)
+
+
+@pytest.mark.django_db
+def test_saving_the_user_invalidates_the_cache(user):
+    _resolve(user)
+    user.bio = "updated"
+    user.save()
+    assert _resolve(user).bio == "updated"
+    user.is_active = False
+    user.save()
+    with pytest.raises(AuthenticationFailed):
+        _resolve(user)
+
+
+@pytest.mark.django_db
+def test_trusted_claims_skip_the_database(user, settings):
+    settings.AUTH_TRUST_TOKEN_CLAIMS = True
+    with CaptureQueriesContext(connection) as queries:
+        resolved = _resolve(user)
+    assert len(queries) == 0
+    assert resolved.pk == user.pk
+    assert resolved.username == "cached"
+
+
+@pytest.mark.django_db
+def test_verified_token_is_cached_until_it_expires(user, monkeypatch):
+    raw = str(AccessToken.for_user(user))
+    hits = auth.tokens.hits
+    token = auth.AuthJWT.get_validated_token(raw)
+    assert auth.AuthJWT.get_validated_token(raw) is token
+    assert auth.tokens.hits == hits + 1
+    assert len(auth.tokens) == 1
+    with pytest.raises(InvalidToken):
+        auth.AuthJWT.get_validated_token(raw[:-2] + "xx")
+    # Far past the token's expiry, as far as the cache is concerned.
+    monkeypatch.setattr("helpers.lru.time.monotonic", lambda: 10**12)
+    assert auth.AuthJWT.get_validated_token(raw) is not token
+
+
+def test_cached_token_is_still_checked_against_the_blacklist():
+    class Blacklisted:
+        def check_blacklist(self):
+            raise TokenError("Token is blacklisted")
+
+    key = sha256(b"raw").digest()
+    auth.tokens.set(key, Blacklisted())
+    with pytest.raises(InvalidToken):
+        auth.AuthJWT.get_validated_token("raw")
+    assert auth.tokens.get(key) is None
+
+
+def test_lru_cache_evicts_and_expires(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("helpers.lru.time.monotonic", lambda: now[0])
+    cache = LRUCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    now[0] = 11
+    assert cache.get("a") is None
+    assert cache.stats() == {"hits": 2, "misses": 2, "size": 1}
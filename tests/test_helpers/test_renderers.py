@@ -0,0 +1,48 @@
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import UUID
+
+from django.test import RequestFactory
+from django.utils.translation import gettext_lazy
+from ninja import Schema
+from ninja.renderers import JSONRenderer
+
+from helpers.renderers import ORJSONParser, ORJSONRenderer
+
+
+class Item(Schema):
+    name: str
+    created_at: datetime
+
+
+def _render(renderer, data):
+    return json.loads(renderer.render(None, data, response_status=200))
+
+
+def test_renderer_matches_stdlib_renderer():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+    data = {
+        "uuid": UUID("12345678-1234-5678-1234-567812345678"),
+        "created_at": created_at,
+        "model": Item(name="item", created_at=created_at),
+        "lazy": gettext_lazy("text"),
+        "decimal": Decimal("1.5"),
+        "nested": [{"none": None, "bool": True}],
+    }
+    assert _render(ORJSONRenderer(), data) == _render(JSONRenderer(), data)
+
+
+def test_renderer_keeps_microseconds_in_utc_z():
+    created_at = datetime(2026, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+    rendered = ORJSONRenderer().render(None, [created_at], response_status=200)
+    assert rendered == b'["2026-01-02T03:04:05.678901Z"]'
+
+
+def test_parser():
+    request = RequestFactory().post(
+        "/",
+        '{"article": {"title": "\\u00e9t\\u00e9"}}',
+        content_type="application/json",
+    )
+    assert ORJSONParser().parse_body(request) == {"article": {"title": "été"}}
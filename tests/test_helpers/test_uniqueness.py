@@ -0,0 +1,72 @@
+import threading
+
+import pytest
+from django.db import IntegrityError, connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import User
+from articles.models import Article
+from helpers import uniqueness
+from helpers.exceptions import clean_integrity_error
+from helpers.uniqueness import BloomFilter
+
+
+@pytest.fixture(autouse=True)
+def reset_probes():
+    uniqueness.reset()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(1000, 0.01)
+    for i in range(1000):
+        bloom.add(f"value{i}")
+    assert all(f"value{i}" in bloom for i in range(1000))
+
+
+def test_bloom_filter_concurrent_adds_keep_every_value():
+    bloom = BloomFilter(20000, 0.01)
+
+    def add(start):
+        for i in range(start, 20000, 4):
+            bloom.add(f"value{i}")
+
+    threads = [threading.Thread(target=add, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert bloom.count == 20000
+    assert all(f"value{i}" in bloom for i in range(20000))
+    false_positives = sum(f"other{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+
+
+@pytest.mark.django_db
+def test_new_values_skip_the_database(django_db):
+    User.objects.create_user(email="taken@test.test", username="taken")
+    uniqueness.probe(User, "email").might_exist("warm-up")
+    uniqueness.probe(User, "username").might_exist("warm-up")
+    with CaptureQueriesContext(connection) as context:
+        assert uniqueness.taken(User, email="new@test.test", username="new") is None
+    assert context.captured_queries == []
+
+
+@pytest.mark.django_db
+def test_taken_values_are_confirmed(django_db):
+    User.objects.create_user(email="first@test.test", username="first")
+    assert uniqueness.taken(User, email="first@test.test") == "email"
+    # Saved after the probe was built.
+    User.objects.create_user(email="second@test.test", username="second")
+    assert uniqueness.taken(User, email="x@test.test", username="second") == "username"
+
+
+@pytest.mark.django_db
+def test_clean_integrity_error_names_the_field(django_db):
+    author = User.objects.create_user(email="author@test.test", username="author")
+    Article.objects.create(author=author, title="Title", summary="s", content="c")
+    with pytest.raises(IntegrityError) as error, transaction.atomic():
+        User.objects.create_user(email="author@test.test", username="other")
+    assert clean_integrity_error(error.value) == "email"
+    with pytest.raises(IntegrityError) as error, transaction.atomic():
+        Article.objects.create(author=author, title="Title", summary="s", content="c")
+    assert clean_integrity_error(error.value) in {"title", "slug"}